@@ -2,13 +2,226 @@
 Service météorologique pour la planification VFR
 """
 
+import asyncio
+import bisect
 import datetime
+import functools
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
 import requests
-import json
-from typing import Dict, Any, Optional, Tuple
-import math
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from cachetools import TTLCache
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, List
+import numpy as np
+
+try:
+    # orjson décode directement les octets de la réponse (pas de passage par str)
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import aiohttp
+except ImportError:
+    # Sans aiohttp, l'analyse de route passe par un pool de threads
+    aiohttp = None
+
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    # Sans diskcache, le cache météo persistant utilise SQLite (_SqliteCache)
+    DiskCache = None
 
 from ..models.waypoint import Waypoint
+from .navigation import calculate_distance
+
+logger = logging.getLogger(__name__)
+
+
+# Points cardinaux, par secteurs de 22.5° à partir du nord
+_CARDINALS = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+)
+
+# Conversion m/s -> knots
+_MS_TO_KT = 1.943844
+
+# Champs horaires Tomorrow.io: (nom API, clé interne, valeur par défaut)
+_WX_FIELDS = (
+    ("windDirection", "wind_direction", 270),
+    ("windSpeed", "wind_speed", 15),
+    ("temperature", "temperature", 15),  # Celsius
+    ("visibility", "visibility", 10),  # km
+    ("cloudCover", "cloud_cover", 20),  # %
+    ("precipitationIntensity", "precipitation", 0),  # mm/h
+    ("weatherCode", "weather_code", 1000),
+)
+
+# API Tomorrow.io: URL de base, en-têtes et champs demandés (invariants entre les appels)
+_BASE_URL = "https://api.tomorrow.io/v4"
+_HEADERS = {
+    "accept": "application/json",
+    "accept-encoding": "br, gzip, deflate"
+}
+_FORECAST_FIELDS = tuple(("fields", api_name) for api_name, _, _ in _WX_FIELDS)
+
+# Nouvelles tentatives des appels API (session requests et aiohttp): nombre, facteur
+# d'attente exponentielle (s) et statuts HTTP temporaires
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Horodatages Tomorrow.io ("...Z"): fromisoformat accepte le suffixe Z depuis Python 3.11
+if sys.version_info >= (3, 11):
+    _parse_api_time = datetime.datetime.fromisoformat
+else:
+    def _parse_api_time(api_time: str) -> datetime.datetime:
+        return datetime.datetime.fromisoformat(api_time.replace('Z', '+00:00'))
+
+
+def _event_loop_running() -> bool:
+    """
+    Indiquer si une boucle d'événements asyncio tourne dans le thread courant.
+
+    :return: True si `asyncio.run` ne peut pas être appelé depuis ce thread
+    :rtype: bool
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# Emplacement par défaut du cache météo persistant (partagé entre les sessions)
+DEFAULT_CACHE_PATH = os.path.join("~", ".vfr_planner", "wx_cache")
+_DISK_CACHE_SIZE_LIMIT = 64 * 1024 * 1024  # 64 Mo
+
+
+@dataclass
+class RouteWeather:
+    """
+    Données météo d'une route stockées par colonnes (une liste ou un tableau par grandeur).
+
+    Les statistiques et alertes de route parcourent ainsi des tableaux contigus
+    plutôt qu'une liste de dictionnaires imbriqués.
+
+    :param names: Noms des waypoints
+    :type names: List[str]
+    :param times: Heures de passage (format "HH:MM UTC")
+    :type times: List[str]
+    :param wind_speeds: Vitesses du vent en knots
+    :type wind_speeds: np.ndarray
+    :param wind_directions: Directions du vent en degrés
+    :type wind_directions: np.ndarray
+    :param visibilities: Visibilités en km
+    :type visibilities: np.ndarray
+    :param precipitations: Précipitations en mm/h
+    :type precipitations: np.ndarray
+    :param cloud_covers: Couvertures nuageuses en %
+    :type cloud_covers: np.ndarray
+    """
+
+    names: List[str]
+    times: List[str]
+    wind_speeds: np.ndarray
+    wind_directions: np.ndarray
+    visibilities: np.ndarray
+    precipitations: np.ndarray
+    cloud_covers: np.ndarray
+
+    @classmethod
+    def from_points(cls, weather_points: list) -> "RouteWeather":
+        """
+        Construire les colonnes à partir de la liste de points météo retournée par l'API du service.
+
+        :param weather_points: Liste de points contenant des données météo
+        :type weather_points: list[Dict[str, Any]]
+
+        :return: Données météo de la route par colonnes
+        :rtype: RouteWeather
+        """
+        count = len(weather_points)
+        weathers = [wp['weather'] for wp in weather_points]
+
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((weather[key] for weather in weathers), dtype=np.float64, count=count)
+
+        return cls(
+            names=[wp['waypoint'] for wp in weather_points],
+            times=[wp['time'] for wp in weather_points],
+            wind_speeds=column('wind_speed'),
+            wind_directions=column('wind_direction'),
+            visibilities=column('visibility'),
+            precipitations=column('precipitation'),
+            cloud_covers=column('cloud_cover')
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class _SqliteCache:
+    """
+    Cache disque minimal sur SQLite, utilisé lorsque `diskcache` n'est pas installé.
+
+    Expose le sous-ensemble de l'API de `diskcache.Cache` utilisé par le service
+    (get, set, touch, close). Les valeurs sont sérialisées en JSON.
+
+    :param directory: Répertoire du cache
+    :type directory: str
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, "wx_cache.sqlite3"),
+                                     check_same_thread=False, isolation_level=None)
+        # WAL: les lectures ne sont pas bloquées par les écritures
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS wx "
+                           "(key TEXT PRIMARY KEY, body BLOB NOT NULL, expire REAL NOT NULL)")
+        # Purge des entrées expirées à l'ouverture pour borner la taille
+        self._conn.execute("DELETE FROM wx WHERE expire < ?", (time.time(),))
+
+    @staticmethod
+    def _key(key) -> str:
+        return ",".join(map(str, key)) if isinstance(key, tuple) else str(key)
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM wx WHERE key = ? AND expire >= ?",
+                                     (self._key(key), time.time())).fetchone()
+        return _loads(row[0]) if row is not None else None
+
+    def set(self, key, value, expire: float):
+        body = _dumps(value)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO wx (key, body, expire) VALUES (?, ?, ?)",
+                               (self._key(key), body, time.time() + expire))
+
+    def touch(self, key, expire: float):
+        with self._lock:
+            self._conn.execute("UPDATE wx SET expire = ? WHERE key = ?",
+                               (time.time() + expire, self._key(key)))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
 
 
 class WeatherService:
@@ -17,16 +230,64 @@ class WeatherService:
 
     :param api_key: Clé API pour l'accès au service Tomorrow.io
     :type api_key: Optional[str]
+    :param cache_path: Répertoire du cache météo persistant (None pour le désactiver)
+    :type cache_path: Optional[str]
+    :param cache_size: Nombre maximal d'entrées du cache mémoire (les moins récemment utilisées sont évincées)
+    :type cache_size: int
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 cache_size: int = 512):
         self.api_key = api_key
-        self.base_url = "https://api.tomorrow.io/v4"
+        self.base_url = _BASE_URL
         self.timeout = 10
 
-        # Cache pour éviter les appels répétés
-        self._cache = {}
+        # Session persistante: keep-alive entre les appels et réponses compressées (br/gzip)
+        self._session = requests.Session()
+        self._session.headers.update(_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF,
+                              status_forcelist=_RETRY_STATUSES)
+        )
+        self._session.mount("https://", adapter)
+
+        # Cache borné (LRU) avec expiration pour éviter les appels répétés
         self._cache_duration = 3600  # 1 heure
+        self._cache = TTLCache(maxsize=cache_size, ttl=self._cache_duration)
+        # TTLCache n'est pas thread-safe (lectures comprises, ordre LRU mis à jour)
+        self._cache_lock = threading.Lock()
+
+        # Échecs récents de l'API (clés identiques au cache): évite de répéter un appel
+        # voué à l'échec (et son délai d'attente) pour chaque point pendant une panne.
+        # Protégé par _cache_lock, comme le cache mémoire
+        self._neg_cache = TTLCache(maxsize=128, ttl=60)
+
+        # Cache disque (niveau 2), ouvert au premier accès pour survivre aux redémarrages
+        self._cache_path = cache_path
+        self._disk_cache = None
+
+    def close(self):
+        """
+        Fermer la session HTTP et le cache disque.
+        """
+        self._session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
 
     def set_api_key(self, api_key: str):
         """
@@ -58,40 +319,64 @@ class WeatherService:
         :return: Dictionnaire contenant les données météo, incluant la direction et la vitesse du vent
         :rtype: Dict[str, Any]
         """
+        # Utiliser le centre du segment pour la météo
+        center_lat = (start_wp.lat + end_wp.lat) / 2
+        center_lon = (start_wp.lon + end_wp.lon) / 2
+
+        return self._get_weather_at(center_lat, center_lon, start_time)
+
+    def _get_weather_at(self, lat: float, lon: float,
+                        start_time: datetime.datetime) -> Dict[str, Any]:
+        """
+        Obtenir la météo à une position donnée, en passant par le cache.
+
+        En cas d'erreur (clé API absente, échec de l'appel), les valeurs par défaut sont retournées.
+
+        :param lat: Latitude du point
+        :type lat: float
+        :param lon: Longitude du point
+        :type lon: float
+        :param start_time: Heure exacte pour laquelle récupérer les conditions météo
+        :type start_time: datetime.datetime
+
+        :return: Dictionnaire contenant les données météo
+        :rtype: Dict[str, Any]
+        """
         try:
             if not self.api_key:
                 raise ValueError("Clé API Tomorrow.io requise")
 
-            # Utiliser le centre du segment pour la météo
-            center_lat = (start_wp.lat + end_wp.lat) / 2
-            center_lon = (start_wp.lon + end_wp.lon) / 2
+            logger.debug("Récupération météo: position %.4f, %.4f, heure %s", lat, lon, start_time)
 
-            print(f"      🌤️ Récupération météo:")
-            print(f"         Position: {center_lat:.4f}, {center_lon:.4f} (centre du leg)")
-            print(f"         Heure: {start_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+            # Les prévisions sont horaires: tronquer l'heure une seule fois et la réutiliser
+            hour_dt = start_time.replace(minute=0, second=0, microsecond=0)
 
-            # Vérifier le cache avec timing précis
-            cache_key = f"{center_lat:.3f},{center_lon:.3f},{start_time.strftime('%Y%m%d%H%M')}"
-            if cache_key in self._cache:
-                cached_data, cache_time = self._cache[cache_key]
-                cache_age = (datetime.datetime.now() - cache_time).seconds
-                if cache_age < self._cache_duration:
-                    print(f"         📋 Cache hit (âge: {cache_age}s)")
-                    return cached_data
+            # Vérifier le cache (clé à l'heure, comme la résolution de l'API)
+            cache_key = self._cache_key(lat, lon, hour_dt)
+            cached_data = self._get_cached(cache_key)
+            if cached_data is not None:
+                return cached_data
+            if self._recent_failure(cache_key):
+                logger.warning("Échec API récent pour %s, utilisation des valeurs par défaut", cache_key)
+                return self._get_default_weather()
 
             # Faire l'appel API
-            print(f"         🌐 Appel API Tomorrow.io...")
-            weather_data = self._fetch_tomorrow_io_weather(center_lat, center_lon, start_time)
+            logger.debug("Appel API Tomorrow.io")
+            try:
+                weather_data = self._fetch_tomorrow_io_weather(lat, lon, hour_dt)
+            except Exception:
+                self._mark_failure(cache_key)
+                raise
 
             # Mettre en cache avec timing précis
-            self._cache[cache_key] = (weather_data, datetime.datetime.now())
+            self._set_cached(cache_key, weather_data)
 
-            print(f"         ✅ Météo récupérée: {weather_data['wind_direction']:.0f}°/{weather_data['wind_speed']:.0f}kn")
+            logger.debug("Météo récupérée: %.0f°/%.0fkn", weather_data['wind_direction'], weather_data['wind_speed'])
 
             return weather_data
 
         except Exception as e:
-            print(f"         ❌ Erreur météo: {e}")
+            logger.exception("Erreur météo, utilisation des valeurs par défaut: %s", e)
             return self._get_default_weather()
 
     def _fetch_tomorrow_io_weather(self, lat: float, lon: float,
@@ -116,70 +401,246 @@ class WeatherService:
         :rtype: Dict[str, Any]
         """
         url = f"{self.base_url}/weather/forecast"
-        params = {
-            "location": f"{lat},{lon}",
-            "timesteps": "hourly",
-            "apikey": self.api_key,
-            "fields": [
-                "windSpeed",
-                "windDirection",
-                "temperature",
-                "visibility",
-                "cloudCover",
-                "precipitationIntensity",
-                "weatherCode"
-            ]
-        }
-
-        headers = {
-            "accept": "application/json",
-            "accept-encoding": "deflate, gzip, br"
-        }
+        params = self._forecast_params(lat, lon)
 
-        response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+        response = self._session.get(url, params=params, timeout=self.timeout)
         response.raise_for_status()
 
-        data = response.json()
+        data = _loads(response.content)
 
-        # Convertir start_time en format API (arrondi à l'heure)
-        target_hour = start_time.replace(minute=0, second=0, microsecond=0)
-        target_time = target_hour.strftime("%Y-%m-%dT%H:00:00Z")
+        return self._select_hour_data(data, start_time)
 
-        print(f"         🕐 Recherche données pour: {target_time}")
+    def _forecast_params(self, lat: float, lon: float) -> List[Tuple[str, str]]:
+        """
+        Construire les paramètres de requête pour les prévisions horaires Tomorrow.io.
 
-        # Chercher l'heure exacte ou la plus proche
-        best_match = None
-        min_time_diff = float('inf')
+        Les paramètres sont fournis sous forme de liste de paires afin d'être acceptés
+        tels quels par `requests` et par `aiohttp` (un paramètre `fields` par champ).
 
-        for hour_data in data["timelines"]["hourly"]:
-            api_time_str = hour_data["time"]
-            if api_time_str.endswith('Z'):
-                api_time_str = api_time_str[:-1] + '+00:00'
-            hour_time = datetime.datetime.fromisoformat(api_time_str)
+        :param lat: Latitude du point d'intérêt
+        :type lat: float
+        :param lon: Longitude du point d'intérêt
+        :type lon: float
 
-            time_diff = abs((hour_time - target_hour).total_seconds())
+        :return: Liste de paires (nom, valeur)
+        :rtype: List[Tuple[str, str]]
+        """
+        return [
+            ("location", f"{lat},{lon}"),
+            ("timesteps", "hourly"),
+            ("apikey", self.api_key),
+            *_FORECAST_FIELDS
+        ]
 
-            if time_diff < min_time_diff:
-                min_time_diff = time_diff
-                best_match = hour_data
+    def _select_hour_data(self, data: Dict[str, Any],
+                          start_time: datetime.datetime) -> Dict[str, Any]:
+        """
+        Sélectionner dans une réponse Tomorrow.io l'heure correspondant le mieux à `start_time`.
 
-            if hour_data["time"] == target_time:
-                print(f"         🎯 Match exact trouvé: {target_time}")
-                return self._parse_tomorrow_io_data(hour_data)
+        :param data: Réponse JSON décodée de l'API Tomorrow.io
+        :type data: Dict[str, Any]
+        :param start_time: Date et heure pour lesquelles la météo est requise
+        :type start_time: datetime.datetime
 
-        if best_match:
-            time_diff_hours = min_time_diff / 3600
-            print(f"         📍 Meilleur match: {best_match['time']} (écart: {time_diff_hours:.1f}h)")
-            return self._parse_tomorrow_io_data(best_match)
+        :raises Exception: Si aucune donnée horaire n'est disponible dans la réponse API
 
-        if data["timelines"]["hourly"]:
-            first_hour = data["timelines"]["hourly"][0]
-            print(f"         ⚠️ Utilisation première heure disponible: {first_hour['time']}")
-            return self._parse_tomorrow_io_data(first_hour)
+        :return: Dictionnaire des données météo formatées
+        :rtype: Dict[str, Any]
+        """
+        # Heure cible en secondes entières depuis l'epoch, puis au format API
+        target_epoch = _hour_epoch(start_time)
+        target_time = _api_hour(target_epoch)
+
+        logger.debug("Recherche données pour: %s", target_time)
+
+        hourly = data["timelines"]["hourly"]
+
+        # Index par heure: le match exact (cas courant) est une simple recherche dans un dict
+        by_time = {hour_data["time"]: hour_data for hour_data in hourly}
+        exact_match = by_time.get(target_time)
+        if exact_match is not None:
+            logger.debug("Match exact trouvé: %s", target_time)
+            return self._parse_tomorrow_io_data(exact_match)
+
+        # Sinon, chercher l'heure la plus proche: timestamps triés une seule fois, puis dichotomie
+        if hourly:
+            timeline = sorted((int(_parse_api_time(hour_data["time"]).timestamp()), idx)
+                              for idx, hour_data in enumerate(hourly))
+            epochs = [epoch for epoch, _ in timeline]
+
+            pos = bisect.bisect_left(epochs, target_epoch)
+            # Voisins immédiats de la cible: le plus proche des deux
+            neighbours = timeline[max(pos - 1, 0):pos + 1]
+            epoch, idx = min(neighbours, key=lambda entry: abs(entry[0] - target_epoch))
+            best_match = hourly[idx]
+
+            logger.debug("Meilleur match: %s (écart: %.1fh)", best_match['time'], abs(epoch - target_epoch) / 3600)
+            return self._parse_tomorrow_io_data(best_match)
 
         raise Exception("Aucune donnée météo disponible")
 
-    def _parse_tomorrow_io_data(self, hour_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _fetch_hourly_window(self, lat: float, lon: float, start_time: datetime.datetime,
+                             hours: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupérer en un seul appel les prévisions horaires d'une position sur une fenêtre de temps.
+
+        :param lat: Latitude du point d'intérêt
+        :type lat: float
+        :param lon: Longitude du point d'intérêt
+        :type lon: float
+        :param start_time: Début de la fenêtre
+        :type start_time: datetime.datetime
+        :param hours: Durée de la fenêtre en heures
+        :type hours: int
+
+        :raises ValueError: Si la clé API n’est pas définie
+
+        :return: Données météo formatées, indexées par heure au format de l'API
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        if not self.api_key:
+            raise ValueError("Clé API Tomorrow.io requise")
+
+        url = f"{self.base_url}/weather/forecast"
+        response = self._session.get(url, params=self._forecast_params(lat, lon), timeout=self.timeout)
+        response.raise_for_status()
+
+        return self._index_hourly_window(_loads(response.content), start_time, hours)
+
+    def _index_hourly_window(self, data: Dict[str, Any], start_time: datetime.datetime,
+                             hours: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Extraire d'une réponse Tomorrow.io les heures comprises dans une fenêtre de temps.
+
+        :param data: Réponse JSON décodée de l'API Tomorrow.io
+        :type data: Dict[str, Any]
+        :param start_time: Début de la fenêtre
+        :type start_time: datetime.datetime
+        :param hours: Durée de la fenêtre en heures
+        :type hours: int
+
+        :return: Données météo formatées, indexées par heure au format de l'API
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        first_hour = _hour_epoch(start_time)
+        wanted = {_api_hour(first_hour + h * 3600) for h in range(hours + 1)}
+
+        api_timestamp = datetime.datetime.now().isoformat()
+        return {hour_data["time"]: self._parse_tomorrow_io_data(hour_data, api_timestamp)
+                for hour_data in data["timelines"]["hourly"]
+                if hour_data["time"] in wanted}
+
+    def _cache_key(self, lat: float, lon: float, time: datetime.datetime) -> Tuple[float, float, int]:
+        """
+        Construire la clé de cache météo d'une position à une heure donnée.
+
+        La position est arrondie au centième de degré (≈1 km, bien en deçà de la résolution
+        des prévisions) et l'heure au numéro d'heure depuis l'epoch, comme la grille horaire de l'API.
+
+        :param lat: Latitude du point
+        :type lat: float
+        :param lon: Longitude du point
+        :type lon: float
+        :param time: Heure (seule l'heure pleine est retenue)
+        :type time: datetime.datetime
+
+        :return: Clé de cache (latitude, longitude, heure)
+        :rtype: Tuple[float, float, int]
+        """
+        return round(lat, 2), round(lon, 2), _hour_epoch(time) // 3600
+
+    def _get_cached(self, cache_key: Tuple[float, float, int]) -> Optional[Dict[str, Any]]:
+        """
+        Lire une entrée du cache météo si elle n'est pas expirée.
+
+        :param cache_key: Clé de cache (position arrondie et heure)
+        :type cache_key: Tuple[float, float, int]
+
+        :return: Données météo en cache, ou None si absentes ou expirées
+        :rtype: Optional[Dict[str, Any]]
+        """
+        with self._cache_lock:
+            cached_data = self._cache.get(cache_key)
+        disk_cache = self._get_disk_cache()
+
+        if cached_data is None and disk_cache is not None:
+            cached_data = disk_cache.get(cache_key)
+
+        if cached_data is None:
+            return None
+
+        logger.debug("Cache hit: %s", cache_key)
+        # Expiration glissante: une entrée consultée reste en cache
+        with self._cache_lock:
+            self._cache[cache_key] = cached_data
+        if disk_cache is not None:
+            disk_cache.touch(cache_key, expire=self._cache_duration)
+        return cached_data
+
+    def _set_cached(self, cache_key: Tuple[float, float, int], weather_data: Dict[str, Any]):
+        """
+        Mettre en cache des données météo.
+
+        :param cache_key: Clé de cache (position arrondie et heure)
+        :type cache_key: Tuple[float, float, int]
+        :param weather_data: Données météo à conserver
+        :type weather_data: Dict[str, Any]
+        """
+        with self._cache_lock:
+            self._cache[cache_key] = weather_data
+
+        disk_cache = self._get_disk_cache()
+        if disk_cache is not None:
+            disk_cache.set(cache_key, weather_data, expire=self._cache_duration)
+
+    def _recent_failure(self, cache_key: Tuple[float, float, int]) -> bool:
+        """
+        Indiquer si un appel API a échoué récemment pour cette clé.
+
+        :param cache_key: Clé de cache (position arrondie et heure)
+        :type cache_key: Tuple[float, float, int]
+
+        :return: True si un échec de moins d'une minute est enregistré
+        :rtype: bool
+        """
+        with self._cache_lock:
+            return cache_key in self._neg_cache
+
+    def _mark_failure(self, cache_key: Tuple[float, float, int]):
+        """
+        Enregistrer l'échec d'un appel API pour cette clé.
+
+        :param cache_key: Clé de cache (position arrondie et heure)
+        :type cache_key: Tuple[float, float, int]
+        """
+        with self._cache_lock:
+            self._neg_cache[cache_key] = True
+
+    def _get_disk_cache(self):
+        """
+        Obtenir le cache disque, en l'ouvrant au premier appel.
+
+        :return: Cache disque (diskcache, ou SQLite à défaut), ou None s'il est désactivé ou indisponible
+        :rtype: Optional[diskcache.Cache | _SqliteCache]
+        """
+        if self._disk_cache is None and self._cache_path:
+            directory = os.path.expanduser(self._cache_path)
+            try:
+                if DiskCache is not None:
+                    # Taille bornée sur disque aussi (éviction LRU par diskcache)
+                    self._disk_cache = DiskCache(directory,
+                                                 size_limit=_DISK_CACHE_SIZE_LIMIT,
+                                                 eviction_policy='least-recently-used')
+                else:
+                    self._disk_cache = _SqliteCache(directory)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Cache météo disque indisponible (%s): %s", self._cache_path, e)
+                self._cache_path = None
+
+        return self._disk_cache
+
+    def _parse_tomorrow_io_data(self, hour_data: Dict[str, Any],
+                                api_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Extraire et transformer les données météorologiques d'une heure donnée fournies par Tomorrow.io.
 
@@ -187,28 +648,23 @@ class WeatherService:
 
         :param hour_data: Données brutes pour une heure donnée depuis l’API Tomorrow.io
         :type hour_data: Dict[str, Any]
+        :param api_timestamp: Horodatage de la réponse, partagé par toutes ses heures (maintenant par défaut)
+        :type api_timestamp: Optional[str]
 
         :return: Dictionnaire contenant les valeurs météo normalisées
         :rtype: Dict[str, Any]
         """
         values = hour_data["values"]
 
-        parsed_data = {
-            'time': hour_data["time"],
-            'wind_direction': values.get("windDirection", 270),
-            'wind_speed': values.get("windSpeed", 15) * 1.943844,  # m/s -> knots
-            'temperature': values.get("temperature", 15),  # Celsius
-            'visibility': values.get("visibility", 10),  # km
-            'cloud_cover': values.get("cloudCover", 20),  # %
-            'precipitation': values.get("precipitationIntensity", 0),  # mm/h
-            'weather_code': values.get("weatherCode", 1000),
-            'source': 'Tomorrow.io API',
-            'api_timestamp': datetime.datetime.now().isoformat()
-        }
+        parsed_data = {'time': hour_data["time"]}
+        parsed_data.update((key, values.get(api_key, default)) for api_key, key, default in _WX_FIELDS)
+        parsed_data['wind_speed'] *= _MS_TO_KT  # m/s -> knots
+        parsed_data['source'] = 'Tomorrow.io API'
+        parsed_data['api_timestamp'] = api_timestamp or datetime.datetime.now().isoformat()
 
-        print(
-            f"         📊 Données parsées: Vent {parsed_data['wind_direction']:.0f}°/{parsed_data['wind_speed']:.0f}kn, "
-            f"Temp {parsed_data['temperature']:.0f}°C, Vis {parsed_data['visibility']:.0f}km")
+        logger.debug("Données parsées: Vent %.0f°/%.0fkn, Temp %.0f°C, Vis %.0fkm",
+                     parsed_data['wind_direction'], parsed_data['wind_speed'],
+                     parsed_data['temperature'], parsed_data['visibility'])
 
         return parsed_data
 
@@ -221,8 +677,9 @@ class WeatherService:
         :return: Dictionnaire contenant des valeurs météo par défaut
         :rtype: Dict[str, Any]
         """
+        now = datetime.datetime.now().isoformat()
         default_data = {
-            'time': datetime.datetime.now().isoformat(),
+            'time': now,
             'wind_direction': 270,  # Vent d'ouest
             'wind_speed': 15,  # 15 knots
             'temperature': 15,
@@ -231,11 +688,11 @@ class WeatherService:
             'precipitation': 0,
             'weather_code': 1000,
             'source': 'Default values (API error)',
-            'api_timestamp': datetime.datetime.now().isoformat()
+            'api_timestamp': now
         }
 
-        print(
-            f"         🔧 Utilisation valeurs par défaut: {default_data['wind_direction']:.0f}°/{default_data['wind_speed']:.0f}kn")
+        logger.debug("Utilisation valeurs par défaut: %.0f°/%.0fkn",
+                     default_data['wind_direction'], default_data['wind_speed'])
 
         return default_data
 
@@ -244,7 +701,7 @@ class WeatherService:
         """
         Obtenir la météo pour un point spécifique à un instant donné.
 
-        Cette méthode est un raccourci utilisant `get_weather_for_leg` avec le même point en départ et arrivée.
+        Contrairement à `get_weather_for_leg`, aucun point milieu n'est calculé.
 
         :param waypoint: Point de navigation
         :type waypoint: Waypoint
@@ -254,7 +711,7 @@ class WeatherService:
         :return: Données météo au point donné
         :rtype: Dict[str, Any]
         """
-        return self.get_weather_for_leg(waypoint, waypoint, time)
+        return self._get_weather_at(waypoint.lat, waypoint.lon, time)
 
     def get_extended_forecast(self, waypoint: Waypoint,
                               days: int = 3) -> Dict[str, Any]:
@@ -285,10 +742,10 @@ class WeatherService:
                 "apikey": self.api_key
             }
 
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
 
             forecast_days = []
             for day_data in data["timelines"]["daily"][:days]:
@@ -297,7 +754,7 @@ class WeatherService:
                     'date': day_data["time"][:10],
                     'temp_min': values.get("temperatureMin", 10),
                     'temp_max': values.get("temperatureMax", 20),
-                    'wind_speed_avg': values.get("windSpeedAvg", 15) * 1.943844,
+                    'wind_speed_avg': values.get("windSpeedAvg", 15) * _MS_TO_KT,
                     'wind_direction': values.get("windDirectionAvg", 270),
                     'visibility': values.get("visibilityAvg", 10),
                     'precipitation': values.get("precipitationIntensityAvg", 0),
@@ -311,7 +768,7 @@ class WeatherService:
             }
 
         except Exception as e:
-            print(f"Erreur prévisions étendues: {e}")
+            logger.warning("Erreur prévisions étendues: %s", e)
             return {'error': str(e)}
 
     def analyze_weather_for_route(self, waypoints: list,
@@ -324,6 +781,10 @@ class WeatherService:
         la vitesse de croisière, puis récupère la météo à chaque point en conséquence.
         Une synthèse météo est ensuite générée via `_analyze_weather_trends`.
 
+        Si `aiohttp` est disponible, les appels API sont effectués en parallèle via
+        `aanalyze_weather_for_route`; sinon, ou si une boucle d'événements est déjà active
+        dans le thread appelant, ils sont répartis sur un pool de threads.
+
         :param waypoints: Liste ordonnée des points de passage de la route
         :type waypoints: list[Waypoint]
         :param start_time: Heure réelle de départ du vol
@@ -336,62 +797,347 @@ class WeatherService:
         :return: Dictionnaire avec les conditions météo détaillées par segment et une analyse globale
         :rtype: Dict[str, Any]
         """
-        weather_points = []
-        current_time = start_time
+        if aiohttp is not None and not _event_loop_running():
+            return asyncio.run(self.aanalyze_weather_for_route(waypoints, start_time, aircraft_speed))
+
+        # Sans aiohttp, ou appelé depuis du code asynchrone (asyncio.run impossible): pool de threads
+        return self.analyze_weather_for_route_fast(waypoints, start_time, aircraft_speed)
+
+    async def aanalyze_weather_for_route(self, waypoints: list,
+                                         start_time: datetime.datetime,
+                                         aircraft_speed: float = 110) -> Dict[str, Any]:
+        """
+        Version asynchrone de `analyze_weather_for_route`.
 
-        print(f"🌤️ Analyse météo route avec timing réel:")
-        print(f"   Départ: {start_time.strftime('%Y-%m-%d %H:%M UTC')}")
-        print(f"   Vitesse: {aircraft_speed} kn")
+        Toutes les requêtes de prévision sont lancées simultanément dans une même session
+        `aiohttp`, si bien que la latence totale est celle d'un seul appel plutôt que
+        la somme des appels. Un point en erreur reçoit les valeurs météo par défaut.
 
+        :param waypoints: Liste ordonnée des points de passage de la route
+        :type waypoints: list[Waypoint]
+        :param start_time: Heure réelle de départ du vol
+        :type start_time: datetime.datetime
+        :param aircraft_speed: Vitesse de croisière en nœuds (knots)
+        :type aircraft_speed: float
+
+        :return: Dictionnaire avec les conditions météo détaillées par segment et une analyse globale
+        :rtype: Dict[str, Any]
+        """
         try:
-            for i, wp in enumerate(waypoints):
-                print(f"   WP{i + 1}: {wp.name} à {current_time.strftime('%H:%M UTC')}")
-
-                weather = self.get_weather_for_point(wp, current_time)
-                weather_points.append({
-                    'waypoint': wp.name,
-                    'time': current_time.strftime("%H:%M UTC"),
-                    'weather': weather
-                })
+            schedule = self._route_schedule(waypoints, start_time, aircraft_speed)
+            weathers, groups = self._group_uncached_points(schedule)
 
-                # Calcul du temps de vol vers le prochain point
-                if i < len(waypoints) - 1:
-                    next_wp = waypoints[i + 1]
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(timeout=timeout, headers=_HEADERS) as session:
+                results = await asyncio.gather(
+                    *(self._afetch(session, *self._group_window(schedule, indices))
+                      for indices in groups.values()),
+                    return_exceptions=True
+                )
+            windows = dict(zip(groups, results))
 
-                    # Import dynamique pour éviter la dépendance globale
-                    from ..calculations.navigation import calculate_distance
-                    distance_nm = calculate_distance(wp.lat, wp.lon, next_wp.lat, next_wp.lon)
+            weather_points = self._resolve_route_weather(schedule, weathers, groups, windows)
+            return self._build_route_result(weather_points, start_time, aircraft_speed)
 
-                    flight_time_minutes = (distance_nm / aircraft_speed) * 60
+        except Exception as e:
+            logger.exception("Erreur analyse météo route: %s", e)
+            return {'error': str(e)}
 
-                    print(f"      → {next_wp.name}: {distance_nm:.1f}NM, {flight_time_minutes:.0f}min")
+    def analyze_weather_for_route_fast(self, waypoints: list,
+                                       start_time: datetime.datetime,
+                                       aircraft_speed: float = 110) -> Dict[str, Any]:
+        """
+        Variante de `analyze_weather_for_route` qui parallélise les appels sans `aiohttp`.
 
-                    current_time += datetime.timedelta(minutes=flight_time_minutes)
+        Les requêtes `requests` sont réparties sur le pool de threads de `_fetch_windows`
+        (même chemin que `analyze_weather_for_route` sans `aiohttp`): la latence totale est
+        celle de l'appel le plus lent.
 
-            analysis = self._analyze_weather_trends(weather_points)
+        :param waypoints: Liste ordonnée des points de passage de la route
+        :type waypoints: list[Waypoint]
+        :param start_time: Heure réelle de départ du vol
+        :type start_time: datetime.datetime
+        :param aircraft_speed: Vitesse de croisière en nœuds (knots)
+        :type aircraft_speed: float
 
-            print(f"✅ Analyse météo terminée: {len(weather_points)} points")
+        :return: Dictionnaire avec les conditions météo détaillées par segment et une analyse globale
+        :rtype: Dict[str, Any]
+        """
+        try:
+            schedule = self._route_schedule(waypoints, start_time, aircraft_speed)
+            weathers, groups = self._group_uncached_points(schedule)
 
-            return {
-                'route_weather': weather_points,
-                'analysis': analysis,
-                'generated_at': datetime.datetime.now().isoformat(),
-                'flight_start_time': start_time.isoformat(),
-                'aircraft_speed': aircraft_speed
-            }
+            windows = self._fetch_windows(schedule, groups)
+
+            weather_points = self._resolve_route_weather(schedule, weathers, groups, windows)
+            return self._build_route_result(weather_points, start_time, aircraft_speed)
 
         except Exception as e:
-            print(f"❌ Erreur analyse météo route: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Erreur analyse météo route: %s", e)
             return {'error': str(e)}
 
+    def _fetch_windows(self, schedule: list,
+                       groups: Dict[Tuple[float, float], List[int]]) -> Dict[Tuple[float, float], Any]:
+        """
+        Récupérer la fenêtre de prévision de chaque groupe de points, un appel par position.
+
+        Les appels sont répartis sur un pool de threads partageant la session `requests`
+        (connexions réutilisées), si bien que la latence totale est proche d'un seul appel.
+
+        :param schedule: Liste de paires (waypoint, heure de passage)
+        :type schedule: list[Tuple[Waypoint, datetime.datetime]]
+        :param groups: Indices des points à récupérer, regroupés par position
+        :type groups: Dict[Tuple[float, float], List[int]]
+
+        :return: Fenêtre horaire (ou exception levée) par position
+        :rtype: Dict[Tuple[float, float], Any]
+        """
+        windows = {}
+        if not groups:
+            return windows
+
+        with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+            futures = {executor.submit(self._fetch_hourly_window, *self._group_window(schedule, indices)): location
+                       for location, indices in groups.items()}
+            for future in as_completed(futures):
+                try:
+                    windows[futures[future]] = future.result()
+                except Exception as e:
+                    windows[futures[future]] = e
+        return windows
+
+    async def _afetch(self, session, lat: float, lon: float, start_time: datetime.datetime,
+                      hours: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Version asynchrone de `_fetch_hourly_window`.
+
+        Comme la session `requests`, les statuts temporaires (429, 5xx) et les erreurs de
+        connexion sont retentés jusqu'à `_RETRY_TOTAL` fois avec une attente exponentielle
+        (ou l'en-tête Retry-After, borné au délai d'expiration).
+
+        :param session: Session `aiohttp` partagée par toutes les requêtes de la route
+        :type session: aiohttp.ClientSession
+        :param lat: Latitude du point d'intérêt
+        :type lat: float
+        :param lon: Longitude du point d'intérêt
+        :type lon: float
+        :param start_time: Début de la fenêtre
+        :type start_time: datetime.datetime
+        :param hours: Durée de la fenêtre en heures
+        :type hours: int
+
+        :raises ValueError: Si la clé API n’est pas définie
+        :raises aiohttp.ClientError: En cas d'erreur HTTP persistante après les nouvelles tentatives
+
+        :return: Données météo formatées, indexées par heure au format de l'API
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        if not self.api_key:
+            raise ValueError("Clé API Tomorrow.io requise")
+
+        url = f"{self.base_url}/weather/forecast"
+        params = self._forecast_params(lat, lon)
+
+        for attempt in range(_RETRY_TOTAL + 1):
+            delay = _RETRY_BACKOFF * 2 ** attempt
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                        response.raise_for_status()
+                        data = _loads(await response.read())
+                        break
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = min(float(retry_after), self.timeout)
+            except aiohttp.ClientConnectionError:
+                if attempt == _RETRY_TOTAL:
+                    raise
+            logger.debug("Nouvelle tentative API dans %.1f s (%d/%d)", delay, attempt + 1, _RETRY_TOTAL)
+            await asyncio.sleep(delay)
+
+        return self._index_hourly_window(data, start_time, hours)
+
+    def _group_uncached_points(self, schedule: list) -> Tuple[list, Dict[Tuple[float, float], List[int]]]:
+        """
+        Regrouper par position les points de la route absents du cache.
+
+        Les points dont la position arrondie au centième de degré est identique partagent
+        une seule requête de prévision couvrant toutes leurs heures de passage. Le cache
+        n'est consulté qu'une fois par clé (position, heure), même si plusieurs legs la partagent.
+
+        :param schedule: Liste de paires (waypoint, heure de passage)
+        :type schedule: list[Tuple[Waypoint, datetime.datetime]]
+
+        :return: Tuple (données en cache ou None pour chaque point, indices des points à récupérer par position)
+        :rtype: Tuple[list, Dict[Tuple[float, float], List[int]]]
+        """
+        weathers = []
+        groups = {}
+        lookups = {}
+
+        for i, (wp, passage_time) in enumerate(schedule):
+            cache_key = self._cache_key(wp.lat, wp.lon, passage_time)
+            if cache_key in lookups:
+                cached_data = lookups[cache_key]
+            else:
+                cached_data = self._get_cached(cache_key)
+                if cached_data is None and self._recent_failure(cache_key):
+                    # Échec récent: ne pas refaire l'appel
+                    cached_data = self._get_default_weather()
+                lookups[cache_key] = cached_data
+            weathers.append(cached_data)
+            if cached_data is None:
+                groups.setdefault((round(wp.lat, 2), round(wp.lon, 2)), []).append(i)
+
+        return weathers, groups
+
+    def _group_window(self, schedule: list,
+                      indices: List[int]) -> Tuple[float, float, datetime.datetime, int]:
+        """
+        Calculer la position et la fenêtre de temps à demander pour un groupe de points.
+
+        :param schedule: Liste de paires (waypoint, heure de passage)
+        :type schedule: list[Tuple[Waypoint, datetime.datetime]]
+        :param indices: Indices des points du groupe dans `schedule`
+        :type indices: List[int]
+
+        :return: Tuple (latitude, longitude, début de fenêtre, durée en heures)
+        :rtype: Tuple[float, float, datetime.datetime, int]
+        """
+        wp = schedule[indices[0]][0]
+        times = [schedule[i][1] for i in indices]
+        window_start = min(times)
+        hours = int((max(times) - window_start).total_seconds() // 3600) + 1
+        return wp.lat, wp.lon, window_start, hours
+
+    def _resolve_route_weather(self, schedule: list, weathers: list,
+                               groups: Dict[Tuple[float, float], List[int]],
+                               windows: Dict[Tuple[float, float], Any]) -> list:
+        """
+        Associer à chaque point de la route ses données météo à partir des fenêtres récupérées.
+
+        Un point dont l'heure est absente de la fenêtre de son groupe est récupéré
+        individuellement; un groupe en erreur reçoit les valeurs météo par défaut.
+
+        :param schedule: Liste de paires (waypoint, heure de passage)
+        :type schedule: list[Tuple[Waypoint, datetime.datetime]]
+        :param weathers: Données en cache (ou None) pour chaque point
+        :type weathers: list
+        :param groups: Indices des points à récupérer, par position
+        :type groups: Dict[Tuple[float, float], List[int]]
+        :param windows: Fenêtre horaire (ou exception) obtenue pour chaque position
+        :type windows: Dict[Tuple[float, float], Any]
+
+        :return: Liste des points météo de la route
+        :rtype: list[Dict[str, Any]]
+        """
+        stored = set()
+
+        for location, indices in groups.items():
+            window = windows[location]
+            for i in indices:
+                wp, passage_time = schedule[i]
+
+                if isinstance(window, Exception):
+                    logger.warning("Erreur météo (%s), utilisation des valeurs par défaut: %s", wp.name, window)
+                    self._mark_failure(self._cache_key(wp.lat, wp.lon, passage_time))
+                    weathers[i] = self._get_default_weather()
+                    continue
+
+                weather = window.get(_api_hour(_hour_epoch(passage_time)))
+                if weather is None:
+                    weathers[i] = self.get_weather_for_point(wp, passage_time)
+                    continue
+
+                # Une seule écriture en cache par clé (position, heure)
+                cache_key = self._cache_key(wp.lat, wp.lon, passage_time)
+                if cache_key not in stored:
+                    stored.add(cache_key)
+                    self._set_cached(cache_key, weather)
+                weathers[i] = weather
+
+        return [{
+            'waypoint': wp.name,
+            'time': passage_time.strftime("%H:%M UTC"),
+            'weather': weather
+        } for (wp, passage_time), weather in zip(schedule, weathers)]
+
+    def _route_schedule(self, waypoints: list, start_time: datetime.datetime,
+                        aircraft_speed: float) -> List[Tuple[Waypoint, datetime.datetime]]:
+        """
+        Calculer l'heure de passage estimée à chaque waypoint d'une route.
+
+        :param waypoints: Liste ordonnée des points de passage de la route
+        :type waypoints: list[Waypoint]
+        :param start_time: Heure réelle de départ du vol
+        :type start_time: datetime.datetime
+        :param aircraft_speed: Vitesse de croisière en nœuds (knots)
+        :type aircraft_speed: float
+
+        :return: Liste de paires (waypoint, heure de passage)
+        :rtype: List[Tuple[Waypoint, datetime.datetime]]
+        """
+        schedule = []
+        current_time = start_time
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        logger.info("Analyse météo route avec timing réel: départ %s, vitesse %s kn",
+                    start_time.strftime('%Y-%m-%d %H:%M UTC'), aircraft_speed)
+
+        for i, wp in enumerate(waypoints):
+            if debug:
+                logger.debug("WP%d: %s à %s", i + 1, wp.name, current_time.strftime('%H:%M UTC'))
+            schedule.append((wp, current_time))
+
+            # Calcul du temps de vol vers le prochain point
+            if i < len(waypoints) - 1:
+                next_wp = waypoints[i + 1]
+
+                distance_nm = calculate_distance(wp.lat, wp.lon, next_wp.lat, next_wp.lon)
+
+                flight_time_minutes = (distance_nm / aircraft_speed) * 60
+
+                logger.debug("  → %s: %.1fNM, %.0fmin", next_wp.name, distance_nm, flight_time_minutes)
+
+                current_time += datetime.timedelta(minutes=flight_time_minutes)
+
+        return schedule
+
+    def _build_route_result(self, weather_points: list, start_time: datetime.datetime,
+                            aircraft_speed: float) -> Dict[str, Any]:
+        """
+        Assembler le résultat de l'analyse météo d'une route.
+
+        :param weather_points: Liste des points météo de la route
+        :type weather_points: list[Dict[str, Any]]
+        :param start_time: Heure réelle de départ du vol
+        :type start_time: datetime.datetime
+        :param aircraft_speed: Vitesse de croisière en nœuds (knots)
+        :type aircraft_speed: float
+
+        :return: Dictionnaire avec les conditions météo par point et une analyse globale
+        :rtype: Dict[str, Any]
+        """
+        analysis = self._analyze_weather_trends(RouteWeather.from_points(weather_points))
+
+        logger.info("Analyse météo terminée: %d points", len(weather_points))
+
+        return {
+            'route_weather': weather_points,
+            'analysis': analysis,
+            'generated_at': datetime.datetime.now().isoformat(),
+            'flight_start_time': start_time.isoformat(),
+            'aircraft_speed': aircraft_speed
+        }
+
     def analyze_weather_for_itinerary(self, itinerary) -> Dict[str, Any]:
         """
         Analyser la météo pour un itinéraire déjà calculé, avec des timings précis.
 
         Cette méthode utilise les durées de vol précalculées dans les `legs` de l'objet `Itinerary`,
         et récupère les conditions météo à chaque point de l'itinéraire au moment estimé de passage.
+        Comme pour `analyze_weather_for_route`, une seule requête horaire est faite par position
+        et les heures de passage y sont lues localement.
 
         :param itinerary: Objet contenant les waypoints, les legs (segments) et l'heure de départ
         :type itinerary: Itinerary
@@ -402,133 +1148,130 @@ class WeatherService:
         if not itinerary.waypoints or not itinerary.start_time:
             return {'error': 'Itinéraire incomplet (pas de waypoints ou heure de départ)'}
 
-        weather_points = []
-        current_time = itinerary.start_time
+        start_time = itinerary.start_time
+        departure_text = start_time.strftime('%Y-%m-%d %H:%M UTC')
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        print(f"🌤️ Analyse météo pour itinéraire calculé:")
-        print(f"   Départ: {current_time.strftime('%Y-%m-%d %H:%M UTC')}")
-        print(f"   Waypoints: {len(itinerary.waypoints)}")
-        print(f"   Legs: {len(itinerary.legs)}")
+        logger.info("Analyse météo pour itinéraire calculé: départ %s, %d waypoints, %d legs",
+                    departure_text, len(itinerary.waypoints), len(itinerary.legs))
 
         try:
             wp = itinerary.waypoints[0]
-            print(f"   WP1: {wp.name} à {current_time.strftime('%H:%M UTC')} (départ)")
-
-            weather = self.get_weather_for_point(wp, current_time)
-            weather_points.append({
-                'waypoint': wp.name,
-                'time': current_time.strftime("%H:%M UTC"),
-                'weather': weather,
-                'leg_info': 'Départ'
-            })
+            if debug:
+                logger.debug("WP1: %s à %s (départ)", wp.name, start_time.strftime('%H:%M UTC'))
 
+            # Heures de passage précalculées par les legs, puis un seul appel par position
+            schedule = [(wp, start_time)]
+            leg_infos = ['Départ']
+            arrival_time = start_time
             for i, leg in enumerate(itinerary.legs):
-                arrival_time = itinerary.start_time + datetime.timedelta(minutes=leg.time_tot)
+                arrival_time = start_time + datetime.timedelta(minutes=leg.time_tot)
                 wp = leg.ending_wp
 
-                print(f"   WP{i + 2}: {wp.name} à {arrival_time.strftime('%H:%M UTC')} "
-                      f"(après {leg.time_leg:.0f}min de vol)")
+                if debug:
+                    logger.debug("WP%d: %s à %s (après %.0fmin de vol)",
+                                 i + 2, wp.name, arrival_time.strftime('%H:%M UTC'), leg.time_leg)
 
-                weather = self.get_weather_for_point(wp, arrival_time)
-                weather_points.append({
-                    'waypoint': wp.name,
-                    'time': arrival_time.strftime("%H:%M UTC"),
-                    'weather': weather,
-                    'leg_info': f"Leg {i + 1}: {leg.time_leg:.0f}min, {leg.distance:.1f}NM"
-                })
+                schedule.append((wp, arrival_time))
+                leg_infos.append(f"Leg {i + 1}: {leg.time_leg:.0f}min, {leg.distance:.1f}NM")
 
-            analysis = self._analyze_weather_trends(weather_points)
+            weathers, groups = self._group_uncached_points(schedule)
+            windows = self._fetch_windows(schedule, groups)
+            weather_points = self._resolve_route_weather(schedule, weathers, groups, windows)
+            for weather_point, leg_info in zip(weather_points, leg_infos):
+                weather_point['leg_info'] = leg_info
+
+            analysis = self._analyze_weather_trends(RouteWeather.from_points(weather_points))
 
             if itinerary.legs:
                 analysis['flight_summary'] = {
                     'total_time_minutes': itinerary.legs[-1].time_tot,
                     'total_distance_nm': sum(leg.distance for leg in itinerary.legs),
-                    'departure_time': itinerary.start_time.strftime('%Y-%m-%d %H:%M UTC'),
-                    'arrival_time': (itinerary.start_time +
-                                     datetime.timedelta(minutes=itinerary.legs[-1].time_tot)).strftime('%H:%M UTC')
+                    'departure_time': departure_text,
+                    'arrival_time': arrival_time.strftime('%H:%M UTC')
                 }
 
-            print(f"✅ Analyse météo itinéraire terminée: {len(weather_points)} points")
+            logger.info("Analyse météo itinéraire terminée: %d points", len(weather_points))
 
             return {
                 'route_weather': weather_points,
                 'analysis': analysis,
                 'generated_at': datetime.datetime.now().isoformat(),
-                'flight_start_time': itinerary.start_time.isoformat(),
+                'flight_start_time': start_time.isoformat(),
                 'method': 'calculated_itinerary'
             }
 
         except Exception as e:
-            print(f"❌ Erreur analyse météo itinéraire: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Erreur analyse météo itinéraire: %s", e)
             return {'error': str(e)}
 
-    def _analyze_weather_trends(self, weather_points: list) -> Dict[str, Any]:
+    def _analyze_weather_trends(self, route_weather: RouteWeather) -> Dict[str, Any]:
         """
         Analyser les tendances météo globales à partir des différents points de l'itinéraire.
 
         Cette méthode agrège les données météo (vent, visibilité, précipitations) et
         génère une synthèse statistique, ainsi que des alertes pertinentes.
 
-        :param weather_points: Liste de points contenant des données météo
-        :type weather_points: list[Dict[str, Any]]
+        :param route_weather: Données météo de la route par colonnes
+        :type route_weather: RouteWeather
 
         :return: Analyse statistique et alertes météo
         :rtype: Dict[str, Any]
         """
-        if not weather_points:
+        if len(route_weather) == 0:
             return {}
 
-        wind_speeds = [wp['weather']['wind_speed'] for wp in weather_points]
-        wind_directions = [wp['weather']['wind_direction'] for wp in weather_points]
-        visibilities = [wp['weather']['visibility'] for wp in weather_points]
-        precipitations = [wp['weather']['precipitation'] for wp in weather_points]
+        # Une réduction par statistique sur les quatre colonnes à la fois
+        # (lignes: vitesse, direction, visibilité, précipitations)
+        columns = np.vstack((route_weather.wind_speeds, route_weather.wind_directions,
+                             route_weather.visibilities, route_weather.precipitations))
+        mins = columns.min(axis=1).tolist()
+        maxs = columns.max(axis=1).tolist()
+        sums = columns.sum(axis=1).tolist()
+        count = len(route_weather)
 
         return {
             'wind_speed': {
-                'min': min(wind_speeds),
-                'max': max(wind_speeds),
-                'avg': sum(wind_speeds) / len(wind_speeds)
+                'min': mins[0],
+                'max': maxs[0],
+                'avg': sums[0] / count
             },
             'wind_direction': {
-                'avg': self._circular_mean(wind_directions),
-                'variation': max(wind_directions) - min(wind_directions)
+                'avg': self._circular_mean(route_weather.wind_directions),
+                'variation': maxs[1] - mins[1]
             },
             'visibility': {
-                'min': min(visibilities),
-                'avg': sum(visibilities) / len(visibilities)
+                'min': mins[2],
+                'avg': sums[2] / count
             },
             'precipitation': {
-                'max': max(precipitations),
-                'total': sum(precipitations)
+                'max': maxs[3],
+                'total': sums[3]
             },
-            'alerts': self._generate_weather_alerts(weather_points)
+            'alerts': self._generate_weather_alerts(route_weather)
         }
 
-    def _circular_mean(self, angles: list) -> float:
+    def _circular_mean(self, angles) -> float:
         """
         Calculer la moyenne circulaire d'une liste d'angles (en degrés).
 
         Utile pour déterminer la moyenne des directions du vent,
         en prenant en compte la circularité (0° ≈ 360°).
 
-        :param angles: Liste d'angles en degrés
-        :type angles: list[float]
+        :param angles: Angles en degrés (liste ou tableau NumPy)
+        :type angles: list[float] | np.ndarray
 
         :return: Moyenne circulaire en degrés (0–360)
         :rtype: float
         """
-        if not angles:
-            return 0
+        if len(angles) == 0:
+            return 0.0
 
-        x = sum(math.cos(math.radians(angle)) for angle in angles)
-        y = sum(math.sin(math.radians(angle)) for angle in angles)
+        # Somme des vecteurs unitaires e^(iθ) en une seule passe (cos et sin fusionnés)
+        resultant = np.exp(1j * np.deg2rad(np.asarray(angles, dtype=np.float64))).sum()
+        return float((np.degrees(np.angle(resultant)) + 360) % 360)
 
-        mean_rad = math.atan2(y, x)
-        return (math.degrees(mean_rad) + 360) % 360
-
-    def _generate_weather_alerts(self, weather_points: list) -> list:
+    def _generate_weather_alerts(self, route_weather: RouteWeather) -> list:
         """
         Générer une liste d'alertes météo à partir des conditions observées sur l'itinéraire.
 
@@ -538,28 +1281,42 @@ class WeatherService:
         - Précipitations significatives (>1 mm/h)
         - Couverture nuageuse élevée (>80%)
 
-        :param weather_points: Liste des points météo analysés
-        :type weather_points: list[Dict[str, Any]]
+        :param route_weather: Données météo de la route par colonnes
+        :type route_weather: RouteWeather
 
         :return: Liste d'alertes (chaînes de caractères)
         :rtype: list[str]
         """
-        alerts = []
+        names = route_weather.names
+        wind_speeds = route_weather.wind_speeds
+        visibilities = route_weather.visibilities
+        precipitations = route_weather.precipitations
+        cloud_covers = route_weather.cloud_covers
+
+        # Seuils évalués sur les colonnes entières: seuls les points en alerte sont parcourus
+        strong_wind = wind_speeds > 25
+        low_visibility = visibilities < 5
+        heavy_precipitation = precipitations > 1
+        overcast = cloud_covers > 80
+        flagged = np.flatnonzero(strong_wind | low_visibility | heavy_precipitation | overcast)
 
-        for wp in weather_points:
-            weather = wp['weather']
+        alerts = []
+        add_alert = alerts.append
 
-            if weather['wind_speed'] > 25:
-                alerts.append(f"Vent fort à {wp['waypoint']}: {weather['wind_speed']:.0f} kn")
+        # Ordre conservé: par waypoint, puis vent, visibilité, précipitations, nuages
+        for i in flagged.tolist():
+            name = names[i]
+            if strong_wind[i]:
+                add_alert(f"Vent fort à {name}: {wind_speeds[i]:.0f} kn")
 
-            if weather['visibility'] < 5:
-                alerts.append(f"Visibilité réduite à {wp['waypoint']}: {weather['visibility']:.1f} km")
+            if low_visibility[i]:
+                add_alert(f"Visibilité réduite à {name}: {visibilities[i]:.1f} km")
 
-            if weather['precipitation'] > 1:
-                alerts.append(f"Précipitations à {wp['waypoint']}: {weather['precipitation']:.1f} mm/h")
+            if heavy_precipitation[i]:
+                add_alert(f"Précipitations à {name}: {precipitations[i]:.1f} mm/h")
 
-            if weather['cloud_cover'] > 80:
-                alerts.append(f"Ciel très nuageux à {wp['waypoint']}: {weather['cloud_cover']:.0f}%")
+            if overcast[i]:
+                add_alert(f"Ciel très nuageux à {name}: {cloud_covers[i]:.0f}%")
 
         return alerts
 
@@ -596,7 +1353,8 @@ class WeatherService:
 
         return summary
 
-    def _wind_direction_to_cardinal(self, direction: float) -> str:
+    @staticmethod
+    def _wind_direction_to_cardinal(direction: float) -> str:
         """
         Convertir une direction angulaire (en degrés) en point cardinal.
 
@@ -606,26 +1364,33 @@ class WeatherService:
         :return: Point cardinal (ex. : N, NE, SSW)
         :rtype: str
         """
-        directions = [
-            "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-        ]
-
-        index = round(direction / 22.5) % 16
-        return directions[index]
+        return _direction_to_cardinal(direction)
 
-    def is_weather_suitable_for_vfr(self, weather_data: Dict[str, Any]) -> Tuple[bool, list]:
+    def is_weather_suitable_for_vfr(self, weather_data: Dict[str, Any], fast: bool = False) -> Tuple[bool, list]:
         """
         Vérifier si les conditions météo sont compatibles avec un vol en VFR (Visual Flight Rules).
 
         Évalue la visibilité, la couverture nuageuse, les précipitations et le vent.
+        En mode rapide, seules les conditions éliminatoires (visibilité puis précipitations)
+        sont vérifiées et la première raison de refus est retournée immédiatement.
 
         :param weather_data: Données météo analysées
         :type weather_data: Dict[str, Any]
+        :param fast: Arrêter à la première condition éliminatoire, sans remarques sur les nuages et le vent
+        :type fast: bool
 
         :return: Tuple (adapté, raisons), où 'adapté' est un booléen et 'raisons' une liste d'explications
         :rtype: Tuple[bool, list]
         """
+        if fast:
+            visibility = weather_data.get('visibility', 10)
+            if visibility < 5:
+                return False, [f"Visibilité insuffisante: {visibility:.1f} km (min: 5 km)"]
+            precipitation = weather_data.get('precipitation', 0)
+            if precipitation > 2:
+                return False, [f"Précipitations importantes: {precipitation:.1f} mm/h"]
+            return True, []
+
         reasons = []
         suitable = True
 
@@ -657,6 +1422,51 @@ class WeatherService:
         return suitable, reasons
 
 
+def _direction_to_cardinal(direction: float) -> str:
+    """
+    Convertir une direction en point cardinal par simple indexation d'une table.
+
+    :param direction: Direction en degrés (0 à 360)
+    :type direction: float
+
+    :return: Point cardinal (ex. : N, NE, SSW)
+    :rtype: str
+    """
+    # 16 secteurs de 22.5°: arrondi par +0.5 puis masque binaire (équivalent à % 16)
+    return _CARDINALS[int(direction * (16 / 360) + 0.5) & 15]
+
+
+def _hour_epoch(time: datetime.datetime) -> int:
+    """
+    Tronquer une date à l'heure pleine, en secondes depuis l'epoch.
+
+    Une date sans fuseau horaire est considérée en UTC, comme les horodatages de l'API.
+
+    :param time: Date et heure
+    :type time: datetime.datetime
+
+    :return: Timestamp de l'heure pleine
+    :rtype: int
+    """
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=datetime.timezone.utc)
+    return int(time.timestamp()) // 3600 * 3600
+
+
+@functools.lru_cache(maxsize=128)
+def _api_hour(hour_epoch: int) -> str:
+    """
+    Formater une heure pleine comme les horodatages horaires de Tomorrow.io.
+
+    :param hour_epoch: Timestamp de l'heure pleine
+    :type hour_epoch: int
+
+    :return: Heure UTC au format ISO 8601 (ex. : 2024-05-01T14:00:00Z)
+    :rtype: str
+    """
+    return datetime.datetime.fromtimestamp(hour_epoch, datetime.timezone.utc).strftime("%Y-%m-%dT%H:00:00Z")
+
+
 # Instance globale pour faciliter l'utilisation
 weather_service = WeatherService()
 
@@ -694,15 +1504,17 @@ def get_weather_summary(weather_data: Dict[str, Any]) -> str:
     """
     return weather_service.get_weather_summary_text(weather_data)
 
-def check_vfr_conditions(weather_data: Dict[str, Any]) -> Tuple[bool, list]:
+def check_vfr_conditions(weather_data: Dict[str, Any], fast: bool = False) -> Tuple[bool, list]:
     """
     Vérifier si les conditions météo sont favorables au vol à vue (VFR).
 
     :param weather_data: Données météo
     :type weather_data: Dict[str, Any]
+    :param fast: Arrêter à la première condition éliminatoire (utile pour un simple filtrage)
+    :type fast: bool
 
     :return: Tuple contenant un booléen (conditions favorables ou non)
              et une liste d’explications/alertes
     :rtype: Tuple[bool, list]
     """
-    return weather_service.is_weather_suitable_for_vfr(weather_data)
\ No newline at end of file
+    return weather_service.is_weather_suitable_for_vfr(weather_data, fast)
\ No newline at end of file
@@ -3,13 +3,14 @@ Données et base de données d'aéroports
 """
 
 from .airport_db import (
-    AirportDatabase, airport_db,
+    AirportDatabase, airport_db, get_airport_db,
     search_airports, get_airport_by_code, get_airports_near
 )
 
 __all__ = [
     'AirportDatabase',
     'airport_db',
+    'get_airport_db',
     'search_airports',
     'get_airport_by_code',
     'get_airports_near'
@@ -2,9 +2,56 @@
 Base de données d'aéroports pour la planification VFR
 """
 
+import math
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 import os
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from typing import Iterator, List, Dict, Optional, Tuple
+
+try:
+    import pyarrow
+except ImportError:
+    # Sans pyarrow: lecteur CSV C de pandas et pas de cache Parquet
+    pyarrow = None
+
+# Lecteur CSV multithread d'Arrow si disponible
+_CSV_ENGINE = 'c' if pyarrow is None else 'pyarrow'
+
+try:
+    from sklearn.neighbors import BallTree
+except ImportError:
+    # Sans scikit-learn, la recherche de proximité filtre par bande de latitude
+    BallTree = None
+
+from ..calculations.navigation import nav_calc
+
+# Rayon terrestre en milles nautiques, identique à celui des calculs de navigation
+_EARTH_RADIUS_NM = nav_calc.EARTH_RADIUS_KM * nav_calc.KM_TO_NM
+
+# Colonnes texte recherchées et leur version en majuscules, calculée au nettoyage
+_UPPER_COLUMNS = {'name': '_name_upper', 'municipality': '_muni_upper'}
+
+# Nombre de combinaisons de filtres dont le résultat est gardé en mémoire
+_FILTER_CACHE_SIZE = 8
+
+# Colonnes du CSV OurAirports utilisées par l'application, avec leur type
+_CSV_DTYPES = {
+    'id': 'Int64',
+    'ident': str,
+    'type': 'category',
+    'name': str,
+    'latitude_deg': 'float64',
+    'longitude_deg': 'float64',
+    'elevation_ft': 'float64',
+    'iso_country': 'category',
+    'municipality': str,
+    'icao_code': str,
+    'iata_code': str,
+    'gps_code': str,
+    'local_code': str
+}
 
 
 class AirportDatabase:
@@ -16,7 +63,8 @@ class AirportDatabase:
     pour les opérations de planification de vol.
     """
 
-    def __init__(self, csv_path: Optional[str] = None):
+    def __init__(self, csv_path: Optional[str] = None, chunksize: Optional[int] = None,
+                 countries: Optional[List[str]] = None):
         """
         Initialiser la base de données d'aéroports.
 
@@ -24,6 +72,11 @@ class AirportDatabase:
 
         :param csv_path: Chemin vers le fichier CSV d'aéroports (optionnel)
         :type csv_path: Optional[str]
+        :param chunksize: Lire le CSV par blocs de ce nombre de lignes pour limiter la mémoire
+            (optionnel, lecture en une fois par défaut)
+        :type chunksize: Optional[int]
+        :param countries: Codes pays à conserver au chargement (optionnel, tous par défaut)
+        :type countries: Optional[List[str]]
         """
         # Chemins possibles pour le fichier CSV
         if csv_path is None:
@@ -39,8 +92,21 @@ class AirportDatabase:
                     break
 
         self.csv_path = csv_path
+        self.chunksize = chunksize
+        self.load_countries = countries
         self.airports_df = None
         self.filtered_airports = None
+        self._filtered_idx = np.empty(0, dtype=np.intp)
+        self._display_names = np.empty(0, dtype=object)
+        self._blob_text = ''
+        self._blob_offsets = np.zeros(1, dtype=np.int64)
+        self._code_index = {}
+        self._records = []
+        self._tree = None
+        # Résultats des derniers filtrages (LRU), par signature de filtres
+        self._filter_cache = OrderedDict()
+        # Statistiques de la base complète, calculées au premier appel de get_statistics
+        self._stats_cache = None
         self.current_filters = {
             'countries': [],
             'types': [],
@@ -61,28 +127,139 @@ class AirportDatabase:
 
         En cas d'erreur de chargement, un jeu de 9 aéroports standards est utilisé.
         """
-        try:
-            if self.csv_path and os.path.exists(self.csv_path):
+        self._filter_cache.clear()
+        self._stats_cache = None
+
+        if self.csv_path and os.path.exists(self.csv_path):
+            try:
                 print(f"Chargement de la base de données: {self.csv_path}")
-                self.airports_df = pd.read_csv(self.csv_path)
-                self._clean_data()
+                if self.chunksize:
+                    # Seules les lignes retenues de chaque bloc sont gardées en mémoire
+                    self.airports_df = pd.concat(self._read_csv_chunks(self.csv_path), ignore_index=True)
+                    self._categorize_columns()
+                else:
+                    self.airports_df = self._read_parquet_cache()
+                    if self.airports_df is None:
+                        self.airports_df = self._read_csv(self.csv_path)
+                        self._clean_data()
+                        self._write_parquet_cache()
+                    if self.load_countries:
+                        self.airports_df = self._keep_load_countries(self.airports_df).reset_index(drop=True)
+                        self._categorize_columns()
                 print(f"Base de données chargée: {len(self.airports_df)} aéroports")
-            else:
-                print("Fichier CSV non trouvé, utilisation des données de base")
+            # Fichier illisible, mal formé (ParserError est une ValueError) ou sans les colonnes requises
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Erreur lors du chargement: {e}")
                 self._create_fallback_data()
+        else:
+            print("Fichier CSV non trouvé, utilisation des données de base")
+            self._create_fallback_data()
+
+        # Appliquer filtres par défaut
+        self.current_filters = {
+            'countries': ['CA', 'US'],
+            'types': [],
+            'icao_only': False,
+            'iata_only': False
+        }
+        self.apply_filters()
+
+    def _read_csv(self, csv_path: str) -> pd.DataFrame:
+        """
+        Lire uniquement les colonnes utiles du CSV, avec des types explicites.
+
+        Le lecteur ``pyarrow`` est utilisé s'il est installé.
+
+        :param csv_path: Chemin du fichier CSV d'aéroports
+        :type csv_path: str
+        :return: Données brutes des aéroports
+        :rtype: pd.DataFrame
+        """
+        header = pd.read_csv(csv_path, nrows=0).columns
+        usecols = [col for col in _CSV_DTYPES if col in header]
+        return pd.read_csv(csv_path, engine=_CSV_ENGINE, usecols=usecols,
+                           dtype={col: _CSV_DTYPES[col] for col in usecols})
+
+    def _read_csv_chunks(self, csv_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Lire le CSV par blocs, en nettoyant et filtrant chaque bloc par pays dès sa lecture.
+
+        Le lecteur C de pandas est utilisé (le lecteur ``pyarrow`` ne lit pas par blocs).
 
-            # Appliquer filtres par défaut
-            self.current_filters = {
-                'countries': ['CA', 'US'],
-                'types': [],
-                'icao_only': False,
-                'iata_only': False
-            }
-            self.apply_filters()
+        :param csv_path: Chemin du fichier CSV d'aéroports
+        :type csv_path: str
+        :return: Blocs de données nettoyées
+        :rtype: Iterator[pd.DataFrame]
+        """
+        header = pd.read_csv(csv_path, nrows=0).columns
+        usecols = [col for col in _CSV_DTYPES if col in header]
+        # Conversion exacte des flottants, identique au lecteur pyarrow
+        reader = pd.read_csv(csv_path, chunksize=self.chunksize, usecols=usecols,
+                             dtype={col: _CSV_DTYPES[col] for col in usecols}, float_precision='round_trip')
+        for chunk in reader:
+            yield self._keep_load_countries(self._clean_frame(chunk))
+
+    def _keep_load_countries(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ne garder que les aéroports des pays demandés au chargement (``countries``).
+
+        :param df: Données des aéroports
+        :type df: pd.DataFrame
+        :return: Données restreintes aux pays demandés, ou inchangées si aucun pays n'est imposé
+        :rtype: pd.DataFrame
+        """
+        if not self.load_countries or 'iso_country' not in df.columns:
+            return df
+        return df[df['iso_country'].isin(self.load_countries)]
+
+    def _parquet_cache_path(self) -> str:
+        """
+        Chemin du cache Parquet associé au fichier CSV.
+
+        :return: Chemin du cache (à côté du CSV)
+        :rtype: str
+        """
+        return self.csv_path + '.parquet'
+
+    def _read_parquet_cache(self) -> Optional[pd.DataFrame]:
+        """
+        Lire les données déjà nettoyées depuis le cache Parquet, s'il est à jour.
+
+        Le CSV reste la source de référence: un cache plus ancien que le CSV est ignoré.
+
+        :return: Données nettoyées, ou None si le cache est absent, périmé ou illisible
+        :rtype: Optional[pd.DataFrame]
+        """
+        cache_path = self._parquet_cache_path()
+        if pyarrow is None or not os.path.exists(cache_path):
+            return None
+        if os.path.getmtime(cache_path) < os.path.getmtime(self.csv_path):
+            return None
 
+        try:
+            df = pd.read_parquet(cache_path)
         except Exception as e:
-            print(f"Erreur lors du chargement: {e}")
-            self._create_fallback_data()
+            print(f"Cache Parquet ignoré ({e})")
+            return None
+
+        # Cache écrit avant l'ajout des colonnes en majuscules: à régénérer
+        if not set(_UPPER_COLUMNS.values()).issubset(df.columns):
+            return None
+        return df
+
+    def _write_parquet_cache(self):
+        """
+        Enregistrer les données nettoyées en Parquet pour accélérer les prochains chargements.
+
+        Un échec d'écriture (dossier en lecture seule, etc.) n'empêche pas le chargement.
+        """
+        if pyarrow is None:
+            return
+
+        try:
+            self.airports_df.to_parquet(self._parquet_cache_path(), compression='snappy', index=False)
+        except Exception as e:
+            print(f"Impossible d'écrire le cache Parquet: {e}")
 
     def _clean_data(self):
         """
@@ -90,26 +267,45 @@ class AirportDatabase:
 
         - Mise en majuscule et nettoyage des codes (ICAO, IATA, etc.)
         - Remplissage des valeurs manquantes dans les champs textes
-        - Conversion des coordonnées en types numériques
-        - Suppression des lignes sans coordonnées valides
+        - Suppression des lignes sans coordonnées valides (déjà numériques à la lecture)
+        """
+        self.airports_df = self._clean_frame(self.airports_df)
+        self._categorize_columns()
+
+    def _clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Nettoyer un DataFrame d'aéroports (fichier complet ou bloc du CSV).
+
+        :param df: Données brutes des aéroports
+        :type df: pd.DataFrame
+        :return: Données nettoyées
+        :rtype: pd.DataFrame
         """
         # Nettoyer les codes
         for col in ['icao_code', 'iata_code', 'ident', 'local_code', 'gps_code']:
-            if col in self.airports_df.columns:
-                self.airports_df[col] = self.airports_df[col].fillna('').str.upper().str.strip()
+            if col in df.columns:
+                df[col] = df[col].fillna('').str.upper().str.strip()
 
-        # Nettoyer les textes
+        # Nettoyer les textes, et garder leur version en majuscules pour la recherche
         for col in ['name', 'municipality']:
-            if col in self.airports_df.columns:
-                self.airports_df[col] = self.airports_df[col].fillna('Unknown')
-
-        # S'assurer que les coordonnées sont numériques
-        for col in ['latitude_deg', 'longitude_deg']:
-            if col in self.airports_df.columns:
-                self.airports_df[col] = pd.to_numeric(self.airports_df[col], errors='coerce')
+            if col in df.columns:
+                df[col] = df[col].fillna('Unknown')
+                df[_UPPER_COLUMNS[col]] = df[col].str.upper()
 
         # Supprimer les lignes avec coordonnées invalides
-        self.airports_df = self.airports_df.dropna(subset=['latitude_deg', 'longitude_deg'])
+        return df.dropna(subset=['latitude_deg', 'longitude_deg'])
+
+    def _categorize_columns(self):
+        """
+        Convertir les colonnes à faible cardinalité (pays, type) en type ``category``.
+
+        Les filtres ``isin`` et les égalités portent alors sur des codes entiers, et les listes
+        de valeurs disponibles sont directement les catégories (déjà triées).
+        """
+        for col in ('iso_country', 'type'):
+            if col in self.airports_df.columns:
+                categories = self.airports_df[col].astype('category')
+                self.airports_df[col] = categories.cat.remove_unused_categories()
 
     def _create_fallback_data(self):
         """
@@ -136,7 +332,10 @@ class AirportDatabase:
                      'large_airport', 'large_airport', 'large_airport', 'small_airport']
         }
 
-        self.airports_df = pd.DataFrame(fallback_data)
+        self.airports_df = self._clean_frame(pd.DataFrame(fallback_data))
+        self._categorize_columns()
+        self._filter_cache.clear()
+        self._stats_cache = None
         print("Utilisation des données de base (9 aéroports)")
 
     def apply_filters(self):
@@ -150,34 +349,78 @@ class AirportDatabase:
         - ``icao_only`` : Si vrai, ne garder que les aéroports avec un code ICAO
         - ``iata_only`` : Si vrai, ne garder que les aéroports avec un code IATA
 
-        Met à jour l’attribut ``filtered_airports``, un DataFrame avec colonne ``display_name``.
+        Met à jour l’attribut ``filtered_airports`` (lignes retenues de ``airports_df``, sans copie
+        intermédiaire) ainsi que les noms d'affichage correspondants.
         """
         if self.airports_df is None:
             return
 
-        filtered_df = self.airports_df.copy()
+        key = self._filter_key()
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            # Mêmes filtres que récemment: réutiliser le résultat sans refiltrer
+            self._filter_cache.move_to_end(key)
+            (self._filtered_idx, self.filtered_airports, self._display_names, self._blob_text,
+             self._blob_offsets, self._code_index, self._records, self._lat_rad, self._lon_rad, self._tree) = cached
+            print(f"Filtres appliqués: {len(self.filtered_airports)} aéroports retenus")
+            return
+
+        df = self.airports_df
+        mask = np.ones(len(df), dtype=bool)
 
         # Filtre par pays
         if self.current_filters['countries']:
-            filtered_df = filtered_df[filtered_df['iso_country'].isin(self.current_filters['countries'])]
+            mask &= df['iso_country'].isin(self.current_filters['countries']).to_numpy()
 
         # Filtre par type
         if self.current_filters['types']:
-            filtered_df = filtered_df[filtered_df['type'].isin(self.current_filters['types'])]
+            mask &= df['type'].isin(self.current_filters['types']).to_numpy()
 
         # Filtre ICAO seulement
         if self.current_filters['icao_only']:
-            filtered_df = filtered_df[filtered_df['icao_code'] != '']
+            mask &= (df['icao_code'] != '').to_numpy()
 
         # Filtre IATA seulement
         if self.current_filters['iata_only']:
-            filtered_df = filtered_df[filtered_df['iata_code'] != '']
-
-        self.filtered_airports = filtered_df.copy()
-        self.filtered_airports['display_name'] = self._create_display_names(self.filtered_airports)
+            mask &= (df['iata_code'] != '').to_numpy()
+
+        # Une seule sélection de lignes; la base source n'est jamais modifiée ensuite
+        self._filtered_idx = np.flatnonzero(mask)
+        self.filtered_airports = df.iloc[self._filtered_idx]
+        self._display_names = self._create_display_names(self.filtered_airports)
+        self._blob_text, self._blob_offsets = self._create_search_blob(self.filtered_airports)
+        self._code_index = self._create_code_index(self.filtered_airports)
+        # Dictionnaires des aéroports filtrés, par position (partagés: à ne pas modifier)
+        self._records = self._create_records(self.filtered_airports, self._display_names)
+
+        # Coordonnées en radians, contiguës, pour les recherches de proximité vectorisées
+        self._lat_rad = np.radians(self.filtered_airports['latitude_deg'].to_numpy(dtype=np.float64))
+        self._lon_rad = np.radians(self.filtered_airports['longitude_deg'].to_numpy(dtype=np.float64))
+        # Index spatial reconstruit à la première recherche de proximité suivant le filtrage
+        self._tree = None
+
+        self._filter_cache[key] = (self._filtered_idx, self.filtered_airports, self._display_names,
+                                   self._blob_text, self._blob_offsets, self._code_index, self._records,
+                                   self._lat_rad, self._lon_rad, self._tree)
+        if len(self._filter_cache) > _FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
 
         print(f"Filtres appliqués: {len(self.filtered_airports)} aéroports retenus")
 
+    def _filter_key(self) -> tuple:
+        """
+        Construire la signature (hachable) des filtres actuels.
+
+        L'ordre des pays et des types sélectionnés n'influe pas sur le résultat.
+
+        :return: Clé du cache de filtrage
+        :rtype: tuple
+        """
+        return (tuple(sorted(self.current_filters['countries'])),
+                tuple(sorted(self.current_filters['types'])),
+                bool(self.current_filters['icao_only']),
+                bool(self.current_filters['iata_only']))
+
     def _create_display_names(self, df):
         """
         Créer les noms d'affichage pour les aéroports.
@@ -188,34 +431,83 @@ class AirportDatabase:
 
         :param df: DataFrame contenant les données des aéroports
         :type df: pd.DataFrame
-        :return: Liste des noms d'affichage formatés
-        :rtype: List[str]
+        :return: Noms d'affichage formatés, dans l'ordre des lignes
+        :rtype: np.ndarray
+        """
+        def text(col: str) -> pd.Series:
+            if col not in df.columns:
+                return pd.Series('', index=df.index, dtype=object)
+            return df[col].astype(object).fillna('').astype(str)
+
+        icao, iata, ident, local_code = (text(col) for col in ('icao_code', 'iata_code', 'ident', 'local_code'))
+        municipality = text('municipality')
+        country = text('iso_country')
+        name = df['name'].astype(str) if 'name' in df.columns else pd.Series('Unknown', index=df.index)
+        fallback_code = 'ID' + (df['id'].astype(str) if 'id' in df.columns else 'Unknown')
+
+        # Prioriser: ICAO > IATA > ident > local_code (colonnes entières, sans boucle par ligne)
+        code = np.select([icao != '', iata != '', ident != '', local_code != ''],
+                         [icao, iata, ident, local_code], default=fallback_code)
+
+        municipality_part = np.where((municipality != '') & (municipality != 'Unknown'),
+                                     ' (' + municipality + ')', '')
+        country_part = np.where(country != '', ' [' + country + ']', '')
+
+        # Indicateur du type de code: 🔵 ICAO, 🟡 IATA, 🟢 Local/GPS
+        code_marker = np.select([icao != '', iata != ''], [' 🔵', ' 🟡'], default=' 🟢')
+
+        return code + ' - ' + name.to_numpy() + municipality_part + country_part + code_marker
+
+    def _create_code_index(self, df) -> Dict[str, int]:
+        """
+        Indexer les aéroports par code (ICAO, IATA, ident, local_code, gps_code).
+
+        Pour un code présent sur plusieurs lignes, la première ligne du DataFrame est retenue,
+        comme l'ancienne recherche par masques combinés.
+
+        :param df: DataFrame contenant les données des aéroports
+        :type df: pd.DataFrame
+        :return: Position (iloc) de l'aéroport pour chaque code
+        :rtype: Dict[str, int]
         """
-        display_names = []
-        for _, row in df.iterrows():
-            # Prioriser: ICAO > IATA > ident > local_code
-            code = (row.get('icao_code', '') if row.get('icao_code', '') else
-                    row.get('iata_code', '') if row.get('iata_code', '') else
-                    row.get('ident', '') if row.get('ident', '') else
-                    row.get('local_code', '') if row.get('local_code', '') else
-                    f"ID{row.get('id', 'Unknown')}")
-
-            name = f"{code} - {row.get('name', 'Unknown')}"
-            if row.get('municipality') and row.get('municipality') != 'Unknown':
-                name += f" ({row['municipality']})"
-            if row.get('iso_country'):
-                name += f" [{row['iso_country']}]"
-
-            # Indicateur du type de code
-            if row.get('icao_code'):
-                name += " 🔵"  # ICAO
-            elif row.get('iata_code'):
-                name += " 🟡"  # IATA
-            else:
-                name += " 🟢"  # Local/GPS
-
-            display_names.append(name)
-        return display_names
+        positions = np.arange(len(df))
+        pairs = pd.concat([pd.DataFrame({'code': df[col].to_numpy(), 'pos': positions})
+                           for col in ('icao_code', 'iata_code', 'ident', 'local_code', 'gps_code')
+                           if col in df.columns])
+        pairs = pairs[pairs['code'] != '']
+        first = pairs.groupby('code', sort=False)['pos'].min()
+        return dict(zip(first.index, first.tolist()))
+
+    def _create_search_blob(self, df) -> Tuple[str, np.ndarray]:
+        """
+        Créer le texte de recherche des aéroports, calculé une seule fois par filtrage.
+
+        Pour chaque aéroport, les codes (ICAO, IATA, ident, local_code, gps_code), le nom et la
+        municipalité sont concaténés en majuscules, chacun précédé de ``|`` pour pouvoir chercher
+        un début de champ. Les aéroports sont ensuite joints en un seul texte, une ligne chacun.
+        Les codes et les colonnes ``_name_upper``/``_muni_upper`` sont déjà en majuscules
+        depuis le nettoyage.
+
+        :param df: DataFrame contenant les données des aéroports
+        :type df: pd.DataFrame
+        :return: Texte de recherche et position de début de chaque ligne (plus la fin du texte)
+        :rtype: Tuple[str, np.ndarray]
+        """
+        blob = pd.Series('', index=df.index, dtype=object)
+        for col in ('icao_code', 'iata_code', 'ident', 'local_code', 'gps_code'):
+            if col in df.columns:
+                blob = blob + '|' + df[col].fillna('').astype(str)
+
+        for col, upper_col in _UPPER_COLUMNS.items():
+            if upper_col in df.columns:
+                blob = blob + '|' + df[upper_col].astype(str)
+            elif col in df.columns:
+                blob = blob + '|' + df[col].fillna('').astype(str).str.upper()
+
+        lines = blob.tolist()
+        offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+        np.cumsum([len(line) + 1 for line in lines], out=offsets[1:])
+        return '\n'.join(lines) + '\n', offsets
 
     def search_airports(self, query: str, max_results: int = 20) -> List[Dict]:
         """
@@ -223,6 +515,8 @@ class AirportDatabase:
 
         La recherche est insensible à la casse et porte sur plusieurs colonnes :
         codes ICAO, IATA, ident, local_code, gps_code, nom et municipalité.
+        Un aéroport est retenu si l'un de ces champs commence par le terme, pris tel quel
+        (sans expression régulière). Le parcours s'arrête dès ``max_results`` aéroports trouvés.
 
         :param query: Terme de recherche (code ou texte)
         :type query: str
@@ -235,21 +529,20 @@ class AirportDatabase:
             return []
 
         query = query.upper().strip()
+        if '\n' in query:
+            return []
 
-        # Recherche dans toutes les colonnes pertinentes
-        mask = (
-                self.filtered_airports['icao_code'].str.match(query, na=False) |
-                self.filtered_airports['iata_code'].str.match(query, na=False) |
-                self.filtered_airports['ident'].str.match(query, na=False) |
-                self.filtered_airports['local_code'].str.match(query, na=False) |
-                self.filtered_airports['gps_code'].str.match(query, na=False) |
-                self.filtered_airports['name'].str.upper().str.match(query, na=False) |
-                self.filtered_airports['municipality'].str.upper().str.match(query, na=False)
-        )
-
-        results = self.filtered_airports[mask].head(max_results)
+        # Recherche directe dans le texte précalculé: "|terme" = début d'un des champs
+        needle = '|' + query
+        results = []
+        start = self._blob_text.find(needle)
+        while start >= 0 and len(results) < max_results:
+            position = int(np.searchsorted(self._blob_offsets, start, side='right')) - 1
+            results.append(self._records[position])
+            # Reprendre à la ligne suivante pour ne retenir chaque aéroport qu'une fois
+            start = self._blob_text.find(needle, int(self._blob_offsets[position + 1]))
 
-        return [self._row_to_dict(row) for _, row in results.iterrows()]
+        return results
 
     def get_airport_by_code(self, code: str) -> Optional[Dict]:
         """
@@ -263,44 +556,55 @@ class AirportDatabase:
         if self.filtered_airports is None:
             return None
 
-        code = code.upper().strip()
-        match = self.filtered_airports[
-            (self.filtered_airports['icao_code'] == code) |
-            (self.filtered_airports['iata_code'] == code) |
-            (self.filtered_airports['ident'] == code) |
-            (self.filtered_airports['local_code'] == code) |
-            (self.filtered_airports['gps_code'] == code)
-            ]
-
-        if not match.empty:
-            return self._row_to_dict(match.iloc[0])
+        position = self._code_index.get(code.upper().strip())
+        if position is not None:
+            return self._records[position]
         return None
 
-    def _row_to_dict(self, row) -> Dict:
+    def _create_records(self, df, display_names: np.ndarray) -> List[Dict]:
         """
-        Convertit une ligne de DataFrame en dictionnaire.
+        Convertir en une fois toutes les lignes filtrées en dictionnaires d'aéroports.
+
+        Les champs dérivés (ICAO ou ident à défaut, coordonnées et altitude en flottants)
+        sont calculés sur les colonnes entières plutôt que ligne par ligne.
 
-        :param row: Ligne du DataFrame contenant les données d'un aéroport.
-        :type row: dict-like
-        :return: Dictionnaire avec les informations extraites de la ligne.
-        :rtype: Dict
+        :param df: DataFrame contenant les données des aéroports
+        :type df: pd.DataFrame
+        :param display_names: Noms d'affichage, alignés sur les lignes de ``df``
+        :type display_names: np.ndarray
+        :return: Dictionnaires des aéroports, dans l'ordre des lignes du DataFrame.
+        :rtype: List[Dict]
         """
-        return {
-            'icao': row.get('icao_code', '') if row.get('icao_code', '') else row.get('ident', ''),
-            'iata': row.get('iata_code', ''),
-            'ident': row.get('ident', ''),
-            'local_code': row.get('local_code', ''),
-            'gps_code': row.get('gps_code', ''),
-            'name': row.get('name', 'Unknown'),
-            'city': row.get('municipality', 'Unknown'),
-            'country': row.get('iso_country', ''),
-            'type': row.get('type', 'unknown'),
-            'lat': float(row.get('latitude_deg', 0)),
-            'lon': float(row.get('longitude_deg', 0)),
-            'elevation': float(row.get('elevation_ft', 0)) if 'elevation_ft' in row and pd.notna(
-                row.get('elevation_ft')) else 0,
-            'display': row.get('display_name', str(row.get('ident', 'Unknown')))
-        }
+        count = len(df)
+
+        def column(col, default):
+            if col not in df.columns:
+                return np.full(count, default, dtype=object)
+            return df[col].astype(object).to_numpy()
+
+        def number(col):
+            if col not in df.columns:
+                return np.zeros(count)
+            return pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+        icao = column('icao_code', '')
+        ident = column('ident', '')
+
+        return pd.DataFrame({
+            'icao': np.where(icao != '', icao, ident),
+            'iata': column('iata_code', ''),
+            'ident': ident,
+            'local_code': column('local_code', ''),
+            'gps_code': column('gps_code', ''),
+            'name': column('name', 'Unknown'),
+            'city': column('municipality', 'Unknown'),
+            'country': column('iso_country', ''),
+            'type': column('type', 'unknown'),
+            'lat': number('latitude_deg'),
+            'lon': number('longitude_deg'),
+            'elevation': number('elevation_ft'),
+            'display': display_names
+        }).to_dict(orient='records')
 
     def get_available_countries(self) -> List[str]:
         """
@@ -311,7 +615,7 @@ class AirportDatabase:
         """
         if self.airports_df is None:
             return []
-        return sorted(self.airports_df['iso_country'].dropna().unique())
+        return self.airports_df['iso_country'].cat.categories.tolist()
 
     def get_available_types(self) -> List[str]:
         """
@@ -322,7 +626,7 @@ class AirportDatabase:
         """
         if self.airports_df is None:
             return []
-        return sorted(self.airports_df['type'].dropna().unique())
+        return self.airports_df['type'].cat.categories.tolist()
 
     def update_filters(self, countries=None, types=None, icao_only=None, iata_only=None):
         """
@@ -393,20 +697,61 @@ class AirportDatabase:
         if self.filtered_airports is None:
             return []
 
-        from ..calculations.navigation import calculate_distance
+        lat_rad = math.radians(lat)
+        lon_rad = math.radians(lon)
+
+        # Candidats (index spatial ou bande de latitude), puis haversine sur ceux-ci seulement
+        candidates = self._near_candidates(lat_rad, lon_rad, radius_nm)
+        lat2 = self._lat_rad[candidates]
+        dlat = lat2 - lat_rad
+        dlon = self._lon_rad[candidates] - lon_rad
+
+        a = np.sin(dlat / 2) ** 2 + math.cos(lat_rad) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+        distances = _EARTH_RADIUS_NM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+        within = distances <= radius_nm
+        positions = candidates[within]
+        distances = distances[within]
 
+        # Trier par distance (tri stable: ordre de la base conservé à distance égale)
         nearby_airports = []
-        for _, row in self.filtered_airports.iterrows():
-            distance = calculate_distance(lat, lon, row['latitude_deg'], row['longitude_deg'])
-            if distance <= radius_nm:
-                airport_dict = self._row_to_dict(row)
-                airport_dict['distance'] = distance
-                nearby_airports.append(airport_dict)
-
-        # Trier par distance
-        nearby_airports.sort(key=lambda x: x['distance'])
+        for i in np.argsort(distances, kind='stable').tolist():
+            airport_dict = dict(self._records[positions[i]])
+            airport_dict['distance'] = float(distances[i])
+            nearby_airports.append(airport_dict)
         return nearby_airports
 
+    def _near_candidates(self, lat_rad: float, lon_rad: float, radius_nm: float) -> np.ndarray:
+        """
+        Sélectionner les aéroports filtrés susceptibles d'être dans le rayon donné.
+
+        Avec scikit-learn, un ``BallTree`` haversine (construit une fois par filtrage) répond
+        en temps logarithmique; sinon, les aéroports sont préfiltrés par bande de latitude
+        (1° de latitude ≈ 60 NM).
+
+        :param lat_rad: Latitude du point de référence en radians.
+        :type lat_rad: float
+        :param lon_rad: Longitude du point de référence en radians.
+        :type lon_rad: float
+        :param radius_nm: Rayon de recherche en milles nautiques.
+        :type radius_nm: float
+        :return: Positions (iloc) croissantes des aéroports candidats.
+        :rtype: np.ndarray
+        """
+        if BallTree is None:
+            return np.flatnonzero(np.abs(self._lat_rad - lat_rad) <= math.radians(radius_nm / 60))
+
+        if self._tree is None:
+            self._tree = BallTree(np.column_stack((self._lat_rad, self._lon_rad)), metric='haversine')
+            # Garder l'index avec le résultat du filtrage courant
+            key = self._filter_key()
+            if key in self._filter_cache:
+                self._filter_cache[key] = self._filter_cache[key][:-1] + (self._tree,)
+
+        # Marge relative pour ne pas perdre un aéroport situé exactement sur le rayon
+        candidates = self._tree.query_radius([[lat_rad, lon_rad]], r=radius_nm * 1.000001 / _EARTH_RADIUS_NM)[0]
+        return np.sort(candidates)
+
     def get_airports_by_type(self, airport_type: str) -> List[Dict]:
         """
         Obtenir la liste des aéroports correspondant à un type donné.
@@ -419,8 +764,8 @@ class AirportDatabase:
         if self.filtered_airports is None:
             return []
 
-        matching = self.filtered_airports[self.filtered_airports['type'] == airport_type]
-        return [self._row_to_dict(row) for _, row in matching.iterrows()]
+        positions = np.flatnonzero((self.filtered_airports['type'] == airport_type).to_numpy())
+        return [self._records[position] for position in positions.tolist()]
 
     def export_filtered_airports(self, filename: str):
         """
@@ -430,7 +775,10 @@ class AirportDatabase:
         :type filename: str
         """
         if self.filtered_airports is not None:
-            self.filtered_airports.to_csv(filename, index=False)
+            # Colonnes internes (préfixe "_") exclues de l'export
+            columns = [col for col in self.filtered_airports.columns if not col.startswith('_')]
+            export_df = self.filtered_airports[columns].assign(display_name=self._display_names)
+            export_df.to_csv(filename, index=False)
             print(f"Aéroports exportés vers {filename}")
 
     def get_statistics(self) -> Dict:
@@ -443,9 +791,26 @@ class AirportDatabase:
         if self.airports_df is None:
             return {}
 
+        if self._stats_cache is None:
+            self._stats_cache = self._compute_statistics()
+
+        # Seul le nombre d'aéroports filtrés dépend des filtres courants
         stats = {
-            'total_airports': len(self.airports_df),
+            'total_airports': self._stats_cache['total_airports'],
             'filtered_airports': len(self.filtered_airports) if self.filtered_airports is not None else 0,
+        }
+        stats.update(self._stats_cache)
+        return stats
+
+    def _compute_statistics(self) -> Dict:
+        """
+        Calculer les statistiques de la base complète (indépendantes des filtres).
+
+        :return: Dictionnaire contenant diverses statistiques.
+        :rtype: Dict[str, int or dict]
+        """
+        stats = {
+            'total_airports': len(self.airports_df),
             'countries': len(self.airports_df['iso_country'].unique()),
             'types': len(self.airports_df['type'].unique()),
             'with_icao': len(self.airports_df[self.airports_df['icao_code'] != '']),
@@ -492,8 +857,38 @@ class AirportDatabase:
         return f"AirportDatabase(csv_path='{self.csv_path}', airports={len(self)})"
 
 
+@lru_cache(maxsize=None)
+def get_airport_db() -> AirportDatabase:
+    """
+    Obtenir l'instance globale de la base d'aéroports, chargée au premier appel.
+
+    :return: Base de données d'aéroports partagée.
+    :rtype: AirportDatabase
+    """
+    return AirportDatabase()
+
+
+class _LazyAirportDB:
+    """
+    Mandataire de l'instance globale: le CSV n'est lu qu'au premier accès à un attribut,
+    et non à l'import du module.
+    """
+
+    def __getattr__(self, name):
+        return getattr(get_airport_db(), name)
+
+    def __len__(self) -> int:
+        return len(get_airport_db())
+
+    def __str__(self) -> str:
+        return str(get_airport_db())
+
+    def __repr__(self) -> str:
+        return repr(get_airport_db())
+
+
 # Instance globale pour faciliter l'utilisation
-airport_db = AirportDatabase()
+airport_db = _LazyAirportDB()
 
 
 # Fonctions utilitaires exportées
@@ -508,7 +903,7 @@ def search_airports(query: str, max_results: int = 20) -> List[Dict]:
     :return: Liste des aéroports correspondant à la recherche.
     :rtype: List[Dict]
     """
-    return airport_db.search_airports(query, max_results)
+    return get_airport_db().search_airports(query, max_results)
 
 
 def get_airport_by_code(code: str) -> Optional[Dict]:
@@ -520,7 +915,7 @@ def get_airport_by_code(code: str) -> Optional[Dict]:
     :return: Dictionnaire contenant les informations de l'aéroport, ou None si non trouvé.
     :rtype: Optional[Dict]
     """
-    return airport_db.get_airport_by_code(code)
+    return get_airport_db().get_airport_by_code(code)
 
 
 def get_airports_near(lat: float, lon: float, radius_nm: float = 50) -> List[Dict]:
@@ -536,4 +931,4 @@ def get_airports_near(lat: float, lon: float, radius_nm: float = 50) -> List[Dic
     :return: Liste des aéroports proches.
     :rtype: List[Dict]
     """
-    return airport_db.get_airports_near_point(lat, lon, radius_nm)
\ No newline at end of file
+    return get_airport_db().get_airports_near_point(lat, lon, radius_nm)
\ No newline at end of file
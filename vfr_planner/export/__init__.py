@@ -3,22 +3,26 @@ Modules d'export pour VFR Planner
 """
 
 from .excel_export import (
-    export_to_excel, create_simple_excel_export,
+    export_to_excel, export_to_excel_bytes, export_many_to_excel, create_simple_excel_export,
     add_flight_summary_sheet, format_time, format_coordinates
 )
 from .pdf_export import (
-    export_to_pdf, create_simple_pdf_export,
-    create_flight_briefing_pdf, FlightPlanPDFGenerator
+    export_to_pdf, export_to_pdf_async, create_simple_pdf_export,
+    create_flight_briefing_pdf, FlightPlanPDFGenerator, PDFExportError
 )
 
 __all__ = [
     'export_to_excel',
+    'export_to_excel_bytes',
+    'export_many_to_excel',
     'create_simple_excel_export',
     'add_flight_summary_sheet',
     'format_time',
     'format_coordinates',
     'export_to_pdf',
+    'export_to_pdf_async',
     'create_simple_pdf_export',
     'create_flight_briefing_pdf',
-    'FlightPlanPDFGenerator'
+    'FlightPlanPDFGenerator',
+    'PDFExportError'
 ]
\ No newline at end of file
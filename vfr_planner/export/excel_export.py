@@ -2,10 +2,100 @@
 Export de plans de vol vers Excel
 """
 
-import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from __future__ import annotations
+
+import io
+import string
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Dict, Any, Optional, Tuple
+
+# openpyxl et xlsxwriter sont importés dans les fonctions d'export: importer ce module
+# (par exemple pour format_time) ne charge pas les bibliothèques Excel
+if TYPE_CHECKING:
+    import openpyxl
+
+
+@lru_cache(maxsize=None)
+def _excel_styles() -> SimpleNamespace:
+    """
+    Créer une seule fois les styles partagés des exports openpyxl.
+
+    Des objets de style identiques d'un export à l'autre permettent à openpyxl de réutiliser
+    les mêmes entrées de styles.
+
+    :return: Polices, bordure, alignement et remplissage des exports.
+    :rtype: SimpleNamespace
+    """
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+
+    return SimpleNamespace(
+        header_font=Font(bold=True, size=12, color="FFFFFF"),
+        title_font=Font(bold=True, size=16, color="000080"),
+        data_font=Font(size=10),
+        bold_font=Font(bold=True),
+        bold_big_font=Font(bold=True, size=12),
+        red_bold_font=Font(color="FF0000", bold=True),
+        italic_small_font=Font(size=10, italic=True),
+        border=Border(
+            left=Side(style='thin'), right=Side(style='thin'),
+            top=Side(style='thin'), bottom=Side(style='thin')
+        ),
+        center=Alignment(horizontal='center', vertical='center'),
+        header_fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+    )
+
+
+# Largeurs des colonnes du journal de navigation (A à N) et lettres des colonnes de la feuille (A à P)
+_COLUMN_WIDTHS = (6, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 15)
+_COL_LETTERS = tuple(string.ascii_uppercase[:16])
+
+# Informations de l'aéronef et du vol: (libellé, clé de flight_data, format ou None si brut)
+_AIRCRAFT_INFO_SCHEMA = (
+    ("Immatriculation:", 'aircraft_id', None),
+    ("Type d'aéronef:", 'aircraft_type', None),
+    ("Vitesse vraie (TAS):", 'tas', "{} kn"),
+    ("Consommation:", 'fuel_burn', "{} GPH"),
+    ("Capacité carburant:", 'fuel_capacity', "{} gal"),
+    ("Réserve requise:", 'reserve_fuel', "{} min"),
+)
+_FLIGHT_INFO_SCHEMA = (
+    ("Aérodrome de départ:", 'departure', None),
+    ("Aérodrome d'arrivée:", 'destination', None),
+    ("Date de vol:", 'date', None),
+    ("Heure de départ (ETD):", 'etd', None),
+    ("Pilote commandant:", 'pilot', None),
+    ("Briefing météo:", 'weather_brief', None),
+)
+
+# En-têtes des tableaux de legs (export complet et export simple)
+_NAV_HEADERS = (
+    "Leg", "De", "À", "Dist\n(NM)", "Cap Vrai\n(°)", "Cap Mag\n(°)",
+    "Vent Dir\n(°)", "Vent Vit\n(kn)", "Vit Sol\n(kn)", "Temps\n(min)",
+    "Carb Leg\n(gal)", "Carb Tot\n(gal)", "ETA", "Remarques"
+)
+_SIMPLE_HEADERS = ("Leg", "De", "À", "Distance", "Cap", "Vent", "VS", "Temps", "Carburant")
+
+# Colonnes du journal de navigation après le numéro de leg:
+# (clé, défaut, spécification pour format() ou None si la valeur est écrite brute)
+_LEG_COLUMNS = (
+    ('from', '', None),
+    ('to', '', None),
+    ('distance', 0, '.1f'),
+    ('true_course', 0, '.0f'),
+    ('mag_heading', 0, '.0f'),
+    ('wind_dir', 0, '.0f'),
+    ('wind_speed', 0, '.0f'),
+    ('ground_speed', 0, '.0f'),
+    ('leg_time', 0, '.0f'),
+    ('fuel_leg', 0, '.1f'),
+    ('fuel_total', 0, '.1f'),
+    ('eta', '', None),
+    ('remarks', '', None),
+)
 
 
 def export_to_excel(flight_data: Dict[str, Any], legs_data: List[Dict],
@@ -26,207 +116,218 @@ def export_to_excel(flight_data: Dict[str, Any], legs_data: List[Dict],
     :raises Exception: En cas d'erreur lors de la génération ou sauvegarde du fichier Excel.
     """
     try:
-        # Créer workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Plan de Vol VFR"
-
-        # Styles
-        header_font = Font(bold=True, size=12, color="FFFFFF")
-        title_font = Font(bold=True, size=16, color="000080")
-        data_font = Font(size=10)
-        border = Border(
-            left=Side(style='thin'), right=Side(style='thin'),
-            top=Side(style='thin'), bottom=Side(style='thin')
-        )
-        center_align = Alignment(horizontal='center', vertical='center')
-        left_align = Alignment(horizontal='left', vertical='center')
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-
-        # Titre principal
-        ws.merge_cells('A1:P1')
-        ws['A1'] = "PLAN DE VOL VFR - VISUAL FLIGHT RULES FLIGHT PLAN"
-        ws['A1'].font = title_font
-        ws['A1'].alignment = center_align
-
-        # Sous-titre avec date de génération
-        ws.merge_cells('A2:P2')
-        ws['A2'] = f"Généré le {datetime.now().strftime('%Y-%m-%d à %H:%M')}"
-        ws['A2'].alignment = center_align
-        ws['A2'].font = Font(size=10, italic=True)
-
-        # Section informations avion (colonne gauche)
-        row = 4
-        ws.merge_cells(f'A{row}:H{row}')
-        ws[f'A{row}'] = "INFORMATIONS DE L'AÉRONEF"
-        ws[f'A{row}'].font = header_font
-        ws[f'A{row}'].fill = header_fill
-        ws[f'A{row}'].alignment = center_align
-
-        aircraft_info = [
-            ("Immatriculation:", flight_data.get('aircraft_id', 'N/A')),
-            ("Type d'aéronef:", flight_data.get('aircraft_type', 'N/A')),
-            ("Vitesse vraie (TAS):", f"{flight_data.get('tas', 'N/A')} kn"),
-            ("Consommation:", f"{flight_data.get('fuel_burn', 'N/A')} GPH"),
-            ("Capacité carburant:", f"{flight_data.get('fuel_capacity', 'N/A')} gal"),
-            ("Réserve requise:", f"{flight_data.get('reserve_fuel', 'N/A')} min"),
-        ]
-
-        for i, (label, value) in enumerate(aircraft_info):
-            row_num = row + 1 + i
-            ws[f'A{row_num}'] = label
-            ws[f'A{row_num}'].font = Font(bold=True)
-            ws[f'B{row_num}'] = value
-            ws[f'A{row_num}'].border = border
-            ws[f'B{row_num}'].border = border
-
-        # Section informations vol (colonne droite)
-        row = 4
-        ws.merge_cells(f'I{row}:P{row}')
-        ws[f'I{row}'] = "INFORMATIONS DE VOL"
-        ws[f'I{row}'].font = header_font
-        ws[f'I{row}'].fill = header_fill
-        ws[f'I{row}'].alignment = center_align
-
-        flight_info = [
-            ("Aérodrome de départ:", flight_data.get('departure', 'N/A')),
-            ("Aérodrome d'arrivée:", flight_data.get('destination', 'N/A')),
-            ("Date de vol:", flight_data.get('date', 'N/A')),
-            ("Heure de départ (ETD):", flight_data.get('etd', 'N/A')),
-            ("Pilote commandant:", flight_data.get('pilot', 'N/A')),
-            ("Briefing météo:", flight_data.get('weather_brief', 'N/A')),
-        ]
-
-        for i, (label, value) in enumerate(flight_info):
-            row_num = row + 1 + i
-            ws[f'I{row_num}'] = label
-            ws[f'I{row_num}'].font = Font(bold=True)
-            ws[f'J{row_num}'] = value
-            ws[f'I{row_num}'].border = border
-            ws[f'J{row_num}'].border = border
-
-        # Table des legs de navigation
-        nav_start_row = row + len(aircraft_info) + 3
-        ws.merge_cells(f'A{nav_start_row}:P{nav_start_row}')
-        ws[f'A{nav_start_row}'] = "JOURNAL DE NAVIGATION"
-        ws[f'A{nav_start_row}'].font = header_font
-        ws[f'A{nav_start_row}'].fill = header_fill
-        ws[f'A{nav_start_row}'].alignment = center_align
-
-        # En-têtes du tableau de navigation
-        headers = [
-            "Leg", "De", "À", "Dist\n(NM)", "Cap Vrai\n(°)", "Cap Mag\n(°)",
-            "Vent Dir\n(°)", "Vent Vit\n(kn)", "Vit Sol\n(kn)", "Temps\n(min)",
-            "Carb Leg\n(gal)", "Carb Tot\n(gal)", "ETA", "Remarques"
-        ]
-
-        header_row = nav_start_row + 1
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=header_row, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center_align
-            cell.border = border
+        data = _build_flight_plan_xlsx(flight_data, legs_data)
+        # Classeur sérialisé une seule fois en mémoire, puis écrit en un bloc
+        with open(filename, 'wb') as f:
+            f.write(data)
+        print(f"Plan de vol Excel sauvegardé: {filename}")
 
-        # Données des legs
-        total_distance = 0
-        total_time = 0
-        total_fuel = 0
+    except Exception as e:
+        raise Exception(f"Erreur lors de la génération Excel: {e}")
 
-        for i, leg in enumerate(legs_data):
-            row_num = header_row + 1 + i
-            row_data = [
-                i + 1,
-                leg.get('from', ''),
-                leg.get('to', ''),
-                f"{leg.get('distance', 0):.1f}",
-                f"{leg.get('true_course', 0):.0f}",
-                f"{leg.get('mag_heading', 0):.0f}",
-                f"{leg.get('wind_dir', 0):.0f}",
-                f"{leg.get('wind_speed', 0):.0f}",
-                f"{leg.get('ground_speed', 0):.0f}",
-                f"{leg.get('leg_time', 0):.0f}",
-                f"{leg.get('fuel_leg', 0):.1f}",
-                f"{leg.get('fuel_total', 0):.1f}",
-                leg.get('eta', ''),
-                leg.get('remarks', '')
-            ]
-
-            for col, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_num, column=col, value=value)
-                cell.border = border
-                cell.alignment = center_align
-                cell.font = data_font
-
-            total_distance += leg.get('distance', 0)
-            total_time = leg.get('total_time', 0)
-            total_fuel = leg.get('fuel_total', 0)
-
-        # Ligne des totaux
-        totals_row = header_row + len(legs_data) + 1
-        ws[f'A{totals_row}'] = "TOTAUX:"
-        ws[f'A{totals_row}'].font = Font(bold=True, size=12)
-        ws[f'D{totals_row}'] = f"{total_distance:.1f}"
-        ws[f'D{totals_row}'].font = Font(bold=True)
-        ws[f'J{totals_row}'] = f"{total_time:.0f}"
-        ws[f'J{totals_row}'].font = Font(bold=True)
-        ws[f'L{totals_row}'] = f"{total_fuel:.1f}"
-        ws[f'L{totals_row}'].font = Font(bold=True)
-
-        # Section résumé et vérifications
-        summary_row = totals_row + 3
-        ws.merge_cells(f'A{summary_row}:P{summary_row}')
-        ws[f'A{summary_row}'] = "RÉSUMÉ ET VÉRIFICATIONS"
-        ws[f'A{summary_row}'].font = header_font
-        ws[f'A{summary_row}'].fill = header_fill
-        ws[f'A{summary_row}'].alignment = center_align
-
-        # Calculs de sécurité
-        reserve_fuel = flight_data.get('reserve_fuel', 45) * flight_data.get('fuel_burn', 7.5) / 60
-        total_fuel_required = total_fuel + reserve_fuel
-        fuel_capacity = flight_data.get('fuel_capacity', 0)
-
-        summary_info = [
-            ("Temps total de vol:", f"{total_time / 60:.1f} heures ({total_time:.0f} minutes)"),
-            ("Distance totale:", f"{total_distance:.1f} milles nautiques"),
-            ("Carburant de route:", f"{total_fuel:.1f} gallons"),
-            ("Carburant de réserve:", f"{reserve_fuel:.1f} gallons"),
-            ("Carburant total requis:", f"{total_fuel_required:.1f} gallons"),
-            ("Capacité réservoir:", f"{fuel_capacity:.1f} gallons"),
-            ("Marge de sécurité:",
-             f"{fuel_capacity - total_fuel_required:.1f} gallons" if fuel_capacity > 0 else "À vérifier"),
-        ]
-
-        for i, (label, value) in enumerate(summary_info):
-            row_num = summary_row + 1 + i
-            ws[f'A{row_num}'] = label
-            ws[f'A{row_num}'].font = Font(bold=True)
-            ws[f'B{row_num}'] = value
-
-            # Colorer en rouge si carburant insuffisant
-            if "Marge de sécurité" in label and fuel_capacity > 0 and fuel_capacity < total_fuel_required:
-                ws[f'B{row_num}'].font = Font(color="FF0000", bold=True)
-
-        # Signatures et approbations
-        sig_row = summary_row + len(summary_info) + 3
-        ws[f'A{sig_row}'] = "Pilote commandant:"
-        ws[f'F{sig_row}'] = "____________________"
-        ws[f'A{sig_row + 1}'] = "Date et heure:"
-        ws[f'F{sig_row + 1}'] = "____________________"
-
-        # Ajuster la largeur des colonnes
-        column_widths = [6, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 15]
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = width
-
-        # Sauvegarder
-        wb.save(filename)
-        print(f"Plan de vol Excel sauvegardé: {filename}")
 
+def export_many_to_excel(jobs: Iterable[Tuple[Dict[str, Any], List[Dict], str]],
+                         max_workers: Optional[int] = None) -> List[str]:
+    """
+    Exporter plusieurs plans de vol vers Excel en parallèle, un processus par fichier.
+
+    Chaque processus construit son propre workbook et écrit son propre fichier: aucun état
+    n'est partagé. Avec un seul plan, l'export se fait directement dans le processus courant.
+
+    :param jobs: Triplets (flight_data, legs_data, filename), comme pour :func:`export_to_excel`.
+    :type jobs: Iterable[Tuple[Dict[str, Any], List[Dict], str]]
+    :param max_workers: Nombre maximum de processus (défaut: nombre de cœurs).
+    :type max_workers: Optional[int]
+    :return: Noms des fichiers générés, dans l'ordre des plans.
+    :rtype: List[str]
+    :raises Exception: En cas d'erreur lors de la génération d'un des fichiers.
+    """
+    jobs = list(jobs)
+    if len(jobs) <= 1:
+        return [_export_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_export_job, jobs))
+
+
+def _export_job(job: Tuple[Dict[str, Any], List[Dict], str]) -> str:
+    """
+    Exporter un plan de vol (fonction de module, transmissible aux processus).
+
+    :param job: Triplet (flight_data, legs_data, filename).
+    :type job: Tuple[Dict[str, Any], List[Dict], str]
+    :return: Nom du fichier généré.
+    :rtype: str
+    """
+    flight_data, legs_data, filename = job
+    export_to_excel(flight_data, legs_data, filename)
+    return filename
+
+
+def export_to_excel_bytes(flight_data: Dict[str, Any], legs_data: List[Dict]) -> bytes:
+    """
+    Générer le plan de vol Excel en mémoire, sans passer par un fichier.
+
+    :param flight_data: Données générales du vol (voir :func:`export_to_excel`).
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Données des segments du vol.
+    :type legs_data: List[Dict[str, Any]]
+    :return: Contenu du fichier .xlsx.
+    :rtype: bytes
+    :raises Exception: En cas d'erreur lors de la génération du fichier Excel.
+    """
+    try:
+        return _build_flight_plan_xlsx(flight_data, legs_data)
     except Exception as e:
         raise Exception(f"Erreur lors de la génération Excel: {e}")
 
 
+def _build_flight_plan_xlsx(flight_data: Dict[str, Any], legs_data: List[Dict]) -> bytes:
+    """
+    Construire le classeur du plan de vol et le sérialiser en mémoire.
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Données des segments du vol.
+    :type legs_data: List[Dict[str, Any]]
+    :return: Contenu du fichier .xlsx.
+    :rtype: bytes
+    """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+
+    st = _excel_styles()
+
+    # Workbook en écriture seule: les lignes sont écrites dans l'ordre, sans grille en mémoire
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Plan de Vol VFR")
+
+    def styled(value, font=None, fill=None, alignment=None, border=None):
+        # Cellule stylée pour le mode écriture seule
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
+
+    # Ajuster la largeur des colonnes (avant la première ligne en mode écriture seule)
+    dims = ws.column_dimensions
+    for letter, width in zip(_COL_LETTERS, _COLUMN_WIDTHS):
+        dims[letter].width = width
+
+    # Titre principal
+    ws.merged_cells.add('A1:P1')
+    ws.append([styled("PLAN DE VOL VFR - VISUAL FLIGHT RULES FLIGHT PLAN", st.title_font, alignment=st.center)])
+
+    # Sous-titre avec date de génération
+    ws.merged_cells.add('A2:P2')
+    ws.append([styled(f"Généré le {datetime.now().strftime('%Y-%m-%d à %H:%M')}",
+                      st.italic_small_font, alignment=st.center)])
+    ws.append([])
+
+    # Sections informations avion (colonne gauche) et vol (colonne droite), écrites ligne par ligne
+    row = 4
+    ws.merged_cells.add(f'A{row}:H{row}')
+    ws.merged_cells.add(f'I{row}:P{row}')
+    ws.append([styled("INFORMATIONS DE L'AÉRONEF", st.header_font, st.header_fill, st.center)]
+              + [None] * 7
+              + [styled("INFORMATIONS DE VOL", st.header_font, st.header_fill, st.center)])
+
+    aircraft_info = _info_rows(_AIRCRAFT_INFO_SCHEMA, flight_data)
+    flight_info = _info_rows(_FLIGHT_INFO_SCHEMA, flight_data)
+
+    for (label, value), (flight_label, flight_value) in zip(aircraft_info, flight_info):
+        ws.append([styled(label, st.bold_font, border=st.border), styled(value, border=st.border)]
+                  + [None] * 6
+                  + [styled(flight_label, st.bold_font, border=st.border),
+                     styled(flight_value, border=st.border)])
+
+    # Table des legs de navigation
+    nav_start_row = row + len(aircraft_info) + 3
+    ws.append([])
+    ws.append([])
+    ws.merged_cells.add(f'A{nav_start_row}:P{nav_start_row}')
+    ws.append([styled("JOURNAL DE NAVIGATION", st.header_font, st.header_fill, st.center)])
+
+    # En-têtes du tableau de navigation
+    header_row = nav_start_row + 1
+    ws.append([styled(header, st.header_font, st.header_fill, st.center, st.border) for header in _NAV_HEADERS])
+
+    # Style des données résolu une seule fois, puis copié sur chaque cellule des legs
+    # (une copie du tableau d'indices de style au lieu de trois affectations validées par cellule)
+    data_style = styled(None, st.data_font, alignment=st.center, border=st.border)._style
+
+    # Totaux calculés avant l'écriture: la boucle des legs ne fait que formater et écrire
+    total_distance, total_time, total_fuel = _flight_totals(legs_data)
+
+    # Données des legs (méthodes liées une fois hors de la boucle)
+    append = ws.append
+    for i, leg in enumerate(legs_data):
+        get = leg.get
+        row_data = [i + 1] + [get(key, default) if spec is None else format(get(key, default), spec)
+                              for key, default, spec in _LEG_COLUMNS]
+
+        row_cells = []
+        add_cell = row_cells.append
+        for value in row_data:
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(data_style)
+            add_cell(cell)
+        append(row_cells)
+
+    # Ligne des totaux (colonnes A, D, J et L)
+    totals_row = header_row + len(legs_data) + 1
+    ws.append([styled("TOTAUX:", st.bold_big_font), None, None,
+               styled(f"{total_distance:.1f}", st.bold_font), None, None, None, None, None,
+               styled(f"{total_time:.0f}", st.bold_font), None,
+               styled(f"{total_fuel:.1f}", st.bold_font)])
+
+    # Section résumé et vérifications
+    summary_row = totals_row + 3
+    ws.append([])
+    ws.append([])
+    ws.merged_cells.add(f'A{summary_row}:P{summary_row}')
+    ws.append([styled("RÉSUMÉ ET VÉRIFICATIONS", st.header_font, st.header_fill, st.center)])
+
+    # Calculs de sécurité
+    reserve_fuel = flight_data.get('reserve_fuel', 45) * flight_data.get('fuel_burn', 7.5) / 60
+    total_fuel_required = total_fuel + reserve_fuel
+    fuel_capacity = flight_data.get('fuel_capacity', 0)
+
+    summary_info = [
+        ("Temps total de vol:", f"{total_time / 60:.1f} heures ({total_time:.0f} minutes)"),
+        ("Distance totale:", f"{total_distance:.1f} milles nautiques"),
+        ("Carburant de route:", f"{total_fuel:.1f} gallons"),
+        ("Carburant de réserve:", f"{reserve_fuel:.1f} gallons"),
+        ("Carburant total requis:", f"{total_fuel_required:.1f} gallons"),
+        ("Capacité réservoir:", f"{fuel_capacity:.1f} gallons"),
+        ("Marge de sécurité:",
+         f"{fuel_capacity - total_fuel_required:.1f} gallons" if fuel_capacity > 0 else "À vérifier"),
+    ]
+
+    for label, value in summary_info:
+        # Colorer en rouge si carburant insuffisant
+        value_font = None
+        if "Marge de sécurité" in label and fuel_capacity > 0 and fuel_capacity < total_fuel_required:
+            value_font = st.red_bold_font
+        ws.append([styled(label, st.bold_font), styled(value, value_font)])
+
+    # Signatures et approbations
+    ws.append([])
+    ws.append([])
+    ws.append(["Pilote commandant:", None, None, None, None, "____________________"])
+    ws.append(["Date et heure:", None, None, None, None, "____________________"])
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
 def create_simple_excel_export(flight_data: Dict[str, Any], legs_data: List[Dict],
                               filename: str = "simple_flight_plan.xlsx"):
     """
@@ -241,36 +342,36 @@ def create_simple_excel_export(flight_data: Dict[str, Any], legs_data: List[Dict
     :raises Exception: En cas d'erreur lors de l'export Excel.
     """
     try:
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Plan VFR"
+        import xlsxwriter
 
-        # En-tête simple
-        ws['A1'] = "PLAN DE VOL VFR"
-        ws['A3'] = f"Avion: {flight_data.get('aircraft_id', 'N/A')}"
-        ws['A4'] = f"Pilote: {flight_data.get('pilot', 'N/A')}"
-        ws['A5'] = f"Date: {flight_data.get('date', 'N/A')}"
+        # XlsxWriter en mémoire constante: chaque ligne est écrite sur disque puis libérée
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_numbers': False})
+        ws = workbook.add_worksheet("Plan VFR")
 
-        # Table des legs
-        start_row = 7
-        headers = ["Leg", "De", "À", "Distance", "Cap", "Vent", "VS", "Temps", "Carburant"]
+        # En-tête simple
+        ws.write(0, 0, "PLAN DE VOL VFR")
+        ws.write(2, 0, f"Avion: {flight_data.get('aircraft_id', 'N/A')}")
+        ws.write(3, 0, f"Pilote: {flight_data.get('pilot', 'N/A')}")
+        ws.write(4, 0, f"Date: {flight_data.get('date', 'N/A')}")
 
-        for col, header in enumerate(headers, 1):
-            ws.cell(row=start_row, column=col, value=header)
+        # Table des legs (lignes indexées à partir de 0)
+        start_row = 6
+        ws.write_row(start_row, 0, _SIMPLE_HEADERS)
 
         for i, leg in enumerate(legs_data):
-            row = start_row + 1 + i
-            ws.cell(row=row, column=1, value=i + 1)
-            ws.cell(row=row, column=2, value=leg.get('from', ''))
-            ws.cell(row=row, column=3, value=leg.get('to', ''))
-            ws.cell(row=row, column=4, value=f"{leg.get('distance', 0):.1f} NM")
-            ws.cell(row=row, column=5, value=f"{leg.get('mag_heading', 0):.0f}°")
-            ws.cell(row=row, column=6, value=f"{leg.get('wind_dir', 0):.0f}°/{leg.get('wind_speed', 0):.0f}kn")
-            ws.cell(row=row, column=7, value=f"{leg.get('ground_speed', 0):.0f} kn")
-            ws.cell(row=row, column=8, value=f"{leg.get('leg_time', 0):.0f} min")
-            ws.cell(row=row, column=9, value=f"{leg.get('fuel_leg', 0):.1f} gal")
-
-        wb.save(filename)
+            ws.write_row(start_row + 1 + i, 0, [
+                i + 1,
+                leg.get('from', ''),
+                leg.get('to', ''),
+                f"{leg.get('distance', 0):.1f} NM",
+                f"{leg.get('mag_heading', 0):.0f}°",
+                f"{leg.get('wind_dir', 0):.0f}°/{leg.get('wind_speed', 0):.0f}kn",
+                f"{leg.get('ground_speed', 0):.0f} kn",
+                f"{leg.get('leg_time', 0):.0f} min",
+                f"{leg.get('fuel_leg', 0):.1f} gal"
+            ])
+
+        workbook.close()
         print(f"Plan Excel simple sauvegardé: {filename}")
 
     except Exception as e:
@@ -278,6 +379,40 @@ def create_simple_excel_export(flight_data: Dict[str, Any], legs_data: List[Dict
 
 
 # Fonctions utilitaires
+def _info_rows(schema: Tuple, flight_data: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """
+    Construire les paires (libellé, valeur) d'une section d'informations.
+
+    :param schema: Schéma de la section (libellé, clé, format ou None).
+    :type schema: Tuple
+    :param flight_data: Données du vol.
+    :type flight_data: Dict[str, Any]
+    :return: Libellés et valeurs, 'N/A' pour les données absentes.
+    :rtype: List[Tuple[str, Any]]
+    """
+    return [(label, flight_data.get(key, 'N/A') if fmt is None else fmt.format(flight_data.get(key, 'N/A')))
+            for label, key, fmt in schema]
+
+
+def _flight_totals(legs_data: List[Dict]) -> Tuple[float, float, float]:
+    """
+    Calculer les totaux d'un plan de vol.
+
+    Le temps et le carburant sont cumulatifs dans les legs: ceux du dernier leg sont les totaux.
+
+    :param legs_data: Données des segments.
+    :type legs_data: List[Dict]
+    :return: Distance totale (NM), temps total (min) et carburant total (gal).
+    :rtype: Tuple[float, float, float]
+    """
+    total_distance = sum(leg.get('distance', 0) for leg in legs_data)
+    total_time = legs_data[-1].get('total_time', 0) if legs_data else 0
+    total_fuel = legs_data[-1].get('fuel_total', 0) if legs_data else 0
+    return total_distance, total_time, total_fuel
+
+
+# Fonctions pures, souvent appelées avec les mêmes valeurs: résultats mis en cache
+@lru_cache(maxsize=2048)
 def format_time(minutes: float) -> str:
     """
     Formater le temps en heures:minutes.
@@ -292,6 +427,7 @@ def format_time(minutes: float) -> str:
     return f"{hours:02d}:{mins:02d}"
 
 
+@lru_cache(maxsize=2048)
 def format_coordinates(lat: float, lon: float) -> str:
     """
     Formater les coordonnées géographiques en degrés décimaux avec direction.
@@ -311,7 +447,7 @@ def format_coordinates(lat: float, lon: float) -> str:
 def add_flight_summary_sheet(wb: openpyxl.Workbook, flight_data: Dict[str, Any],
                              legs_data: List[Dict]) -> None:
     """
-    Ajouter une feuille de résumé au workbook Excel.
+    Ajouter une feuille de résumé au workbook Excel (normal ou en écriture seule).
 
     :param wb: Workbook Excel où ajouter la feuille.
     :type wb: openpyxl.Workbook
@@ -324,9 +460,7 @@ def add_flight_summary_sheet(wb: openpyxl.Workbook, flight_data: Dict[str, Any],
     ws = wb.create_sheet("Résumé")
 
     # Calculs totaux
-    total_distance = sum(leg.get('distance', 0) for leg in legs_data)
-    total_time = legs_data[-1].get('total_time', 0) if legs_data else 0
-    total_fuel = legs_data[-1].get('fuel_total', 0) if legs_data else 0
+    total_distance, total_time, total_fuel = _flight_totals(legs_data)
 
     # Contenu du résumé
     summary_data = [
@@ -345,14 +479,14 @@ def add_flight_summary_sheet(wb: openpyxl.Workbook, flight_data: Dict[str, Any],
         ["Pilote:", flight_data.get('pilot', 'N/A')],
     ]
 
-    for i, (label, value) in enumerate(summary_data, 1):
-        ws.cell(row=i, column=1, value=label)
-        ws.cell(row=i, column=2, value=value)
-
-    # Ajuster largeurs
+    # Ajuster largeurs (avant les lignes: requis si le workbook est en écriture seule)
     ws.column_dimensions['A'].width = 20
     ws.column_dimensions['B'].width = 15
 
+    # Une ligne complète par appel (fonctionne aussi en mode écriture seule)
+    for row in summary_data:
+        ws.append(row)
+
 
 if __name__ == "__main__":
     # Test de la fonction
@@ -4,212 +4,609 @@ Export de plans de vol vers PDF
 
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus.doctemplate import LayoutError
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch, cm
 from reportlab.pdfgen import canvas
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable, List, Dict, Any
 
+# Erreurs attendues lors d'un export: fichier (OSError), mise en page (LayoutError)
+# et valeurs de vol non formatables (ValueError, TypeError)
+_EXPORT_ERRORS = (OSError, LayoutError, ValueError, TypeError)
 
-def export_to_pdf(flight_data: Dict[str, Any], legs_data: List[Dict],
-                 filename: str = "flight_plan.pdf"):
-    """
-    Exporter un plan de vol vers un fichier PDF.
 
-    :param flight_data: Données générales du vol.
-    :type flight_data: Dict[str, Any]
-    :param legs_data: Liste des segments du vol.
-    :type legs_data: List[Dict]
-    :param filename: Nom du fichier PDF de sortie.
-    :type filename: str
-    :raises Exception: En cas d'erreur lors de la génération du PDF.
+class PDFExportError(RuntimeError):
+    """Erreur de génération d'un export PDF; l'erreur d'origine est dans ``__cause__``."""
+
+
+@lru_cache(maxsize=None)
+def _pdf_styles() -> SimpleNamespace:
     """
-    try:
-        # Configuration du document
-        doc = SimpleDocTemplate(
-            filename,
-            pagesize=letter,
-            leftMargin=0.5 * inch,
-            rightMargin=0.5 * inch,
-            topMargin=0.5 * inch,
-            bottomMargin=0.5 * inch
-        )
+    Créer une seule fois la feuille de styles reportlab et les styles personnalisés des exports.
 
-        # Styles
-        styles = getSampleStyleSheet()
+    getSampleStyleSheet() construit une nouvelle feuille à chaque appel; les styles ne sont
+    que lus pendant la mise en page et peuvent donc être partagés d'un export à l'autre.
 
-        # Styles personnalisés
-        title_style = ParagraphStyle(
+    :return: Feuille de styles de base et styles personnalisés.
+    :rtype: SimpleNamespace
+    """
+    sheet = getSampleStyleSheet()
+    return SimpleNamespace(
+        sheet=sheet,
+        title=ParagraphStyle(
             'CustomTitle',
-            parent=styles['Title'],
+            parent=sheet['Title'],
             fontSize=16,
             spaceAfter=20,
             alignment=1,  # Centre
             textColor=colors.darkblue
-        )
-
-        subtitle_style = ParagraphStyle(
+        ),
+        subtitle=ParagraphStyle(
             'CustomSubtitle',
-            parent=styles['Normal'],
+            parent=sheet['Normal'],
             fontSize=10,
             spaceAfter=15,
             alignment=1,
             textColor=colors.grey
-        )
-
-        heading_style = ParagraphStyle(
+        ),
+        heading=ParagraphStyle(
             'CustomHeading',
-            parent=styles['Heading2'],
+            parent=sheet['Heading2'],
             fontSize=12,
             spaceAfter=10,
             textColor=colors.darkblue
-        )
+        ),
+    )
+
+
+# Styles des tableaux, partagés entre les exports (setStyle ne fait que lire les commandes)
+_GENERAL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (1, 0), colors.darkblue),
+    ('BACKGROUND', (2, 0), (3, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (3, 0), colors.whitesmoke),
+    ('BACKGROUND', (0, 1), (0, -1), colors.lightgrey),
+    ('BACKGROUND', (2, 1), (2, -1), colors.lightgrey),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+_LEGS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 8),
+    ('FONTSIZE', (0, 1), (-1, -1), 7),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+_SIMPLE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+# Textes fixes du briefing et du générateur, analysés une seule fois par _static_paragraph
+_CHECKLIST_TEXT = """
+    <b>LISTE DE VÉRIFICATION PRÉ-VOL</b><br/>
+    <br/>
+    <b>Documentation:</b><br/>
+    ☐ Certificat d'immatriculation<br/>
+    ☐ Certificat de navigabilité<br/>
+    ☐ Licence radio<br/>
+    ☐ Manuel de vol<br/>
+    ☐ Cartes à jour<br/>
+    <br/>
+    <b>Planification:</b><br/>
+    ☐ Plan de vol calculé<br/>
+    ☐ Briefing météo obtenu<br/>
+    ☐ NOTAM vérifiés<br/>
+    ☐ Carburant suffisant<br/>
+    ☐ Aérodromes alternatifs identifiés<br/>
+    <br/>
+    <b>Communications:</b><br/>
+    ☐ Fréquences notées<br/>
+    ☐ Transpondeur testé<br/>
+    ☐ Plan de vol déposé (si requis)<br/>
+    """
+_SAFETY_TEXT = """
+    <b>CONSIGNES DE SÉCURITÉ</b><br/>
+    <br/>
+    • Vérifiez les conditions météo avant le départ<br/>
+    • Respectez les minimums VFR en tout temps<br/>
+    • Maintenez une veille radio appropriée<br/>
+    • Suivez les procédures d'urgence en cas de problème<br/>
+    """
+
+
+@lru_cache(maxsize=None)
+def _static_paragraph(text: str) -> Paragraph:
+    """
+    Analyser une seule fois le balisage d'un texte fixe.
+
+    Le paragraphe renvoyé sert de modèle: chaque document en ajoute une copie superficielle
+    (``copy``), la mise en page modifiant l'état du paragraphe (largeur, lignes).
+
+    :param text: Texte au balisage reportlab (``<b>``, ``<br/>``).
+    :type text: str
+    :return: Paragraphe modèle au style Normal.
+    :rtype: Paragraph
+    """
+    return Paragraph(text, _pdf_styles().sheet['Normal'])
 
-        story = []
 
-        # Titre principal
-        title = Paragraph("PLAN DE VOL VFR<br/>VISUAL FLIGHT RULES FLIGHT PLAN", title_style)
-        story.append(title)
-
-        subtitle = Paragraph(f"Généré le {datetime.now().strftime('%Y-%m-%d à %H:%M')}", subtitle_style)
-        story.append(subtitle)
-
-        # Informations générales en tableau
-        general_data = [
-            ["AÉRONEF", "", "VOL", ""],
-            ["Immatriculation:", flight_data.get('aircraft_id', 'N/A'),
-             "Départ:", flight_data.get('departure', 'N/A')],
-            ["Type:", flight_data.get('aircraft_type', 'N/A'),
-             "Destination:", flight_data.get('destination', 'N/A')],
-            ["TAS:", f"{flight_data.get('tas', 'N/A')} kn",
-             "Date:", flight_data.get('date', 'N/A')],
-            ["Consommation:", f"{flight_data.get('fuel_burn', 'N/A')} GPH",
-             "ETD:", flight_data.get('etd', 'N/A')],
-            ["Capacité:", f"{flight_data.get('fuel_capacity', 'N/A')} gal",
-             "Pilote:", flight_data.get('pilot', 'N/A')],
+# Pool de threads des exports en arrière-plan (les threads sont créés à la première soumission)
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-export")
+
+# Derniers PDF générés (octets) par données de vol; partagé avec les threads d'export
+_PDF_CACHE_SIZE = 8
+_pdf_cache = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+
+def _build_flight_plan_story(flight_data: Dict[str, Any], legs_data: List[Dict],
+                             generated: str) -> List:
+    """
+    Construire les éléments (flowables) du plan de vol détaillé.
+
+    Utilisé par :func:`export_to_pdf` et repris tel quel dans :func:`create_flight_briefing_pdf`.
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :param generated: Date et heure de génération affichées sous le titre.
+    :type generated: str
+    :return: Éléments du document: titre, tableaux et calculs.
+    :rtype: List
+    """
+    # Styles (partagés entre les exports)
+    pdf_styles = _pdf_styles()
+    styles = pdf_styles.sheet
+    title_style = pdf_styles.title
+    subtitle_style = pdf_styles.subtitle
+    heading_style = pdf_styles.heading
+
+    story = []
+
+    # Titre principal
+    title = Paragraph("PLAN DE VOL VFR<br/>VISUAL FLIGHT RULES FLIGHT PLAN", title_style)
+    story.append(title)
+
+    subtitle = Paragraph(f"Généré le {generated}", subtitle_style)
+    story.append(subtitle)
+
+    # Informations générales en tableau (méthode get liée une fois, capacité réutilisée plus bas)
+    get = flight_data.get
+    fuel_capacity = get('fuel_capacity', 'N/A')
+    general_data = [
+        ["AÉRONEF", "", "VOL", ""],
+        ["Immatriculation:", get('aircraft_id', 'N/A'),
+         "Départ:", get('departure', 'N/A')],
+        ["Type:", get('aircraft_type', 'N/A'),
+         "Destination:", get('destination', 'N/A')],
+        ["TAS:", f"{get('tas', 'N/A')} kn",
+         "Date:", get('date', 'N/A')],
+        ["Consommation:", f"{get('fuel_burn', 'N/A')} GPH",
+         "ETD:", get('etd', 'N/A')],
+        ["Capacité:", f"{fuel_capacity} gal",
+         "Pilote:", get('pilot', 'N/A')],
+    ]
+
+    general_table = Table(general_data, colWidths=[1.2 * inch, 1.8 * inch, 1.2 * inch, 1.8 * inch])
+    general_table.setStyle(_GENERAL_TABLE_STYLE)
+
+    story.append(general_table)
+    story.append(Spacer(1, 20))
+
+    # Table des segments de navigation
+    nav_heading = Paragraph("JOURNAL DE NAVIGATION", heading_style)
+    story.append(nav_heading)
+
+    # En-têtes du tableau des legs
+    headers = [
+        "Leg", "De", "À", "Dist\n(NM)", "CV\n(°)", "CM\n(°)",
+        "Vent", "VS\n(kn)", "Temps\n(min)", "Carb\n(gal)", "ETA"
+    ]
+
+    legs_table_data = [headers]
+
+    # Données des legs (la distance totale est cumulée dans le même parcours)
+    total_distance = 0
+    for i, leg in enumerate(legs_data, 1):
+        distance = leg.get('distance', 0)
+        total_distance += distance
+        wind_str = f"{leg.get('wind_dir', 0):.0f}°/{leg.get('wind_speed', 0):.0f}"
+        row = [
+            str(i),
+            leg.get('from', '')[:6],  # Limiter la longueur
+            leg.get('to', '')[:6],
+            f"{distance:.0f}",
+            f"{leg.get('true_course', 0):.0f}",
+            f"{leg.get('mag_heading', 0):.0f}",
+            wind_str,
+            f"{leg.get('ground_speed', 0):.0f}",
+            f"{leg.get('leg_time', 0):.0f}",
+            f"{leg.get('fuel_leg', 0):.1f}",
+            leg.get('eta', '')[:5]
         ]
+        legs_table_data.append(row)
+
+    # Calculer largeurs colonnes
+    col_widths = [0.4, 0.6, 0.6, 0.5, 0.4, 0.4, 0.6, 0.4, 0.5, 0.5, 0.5]
+    col_widths = [w * inch for w in col_widths]
+
+    legs_table = Table(legs_table_data, colWidths=col_widths, repeatRows=1)
+    legs_table.setStyle(_LEGS_TABLE_STYLE)
+
+    story.append(legs_table)
+    story.append(Spacer(1, 20))
+
+    # Calculs et vérifications (temps et carburant cumulés au dernier leg)
+    last_leg = legs_data[-1] if legs_data else {}
+    total_time = last_leg.get('total_time', 0)
+    total_fuel = last_leg.get('fuel_total', 0)
+    reserve_fuel = get('reserve_fuel', 45) * get('fuel_burn', 7.5) / 60
+    total_fuel_required = total_fuel + reserve_fuel
+
+    calculations_text = f"""
+    <b>CALCULS ET VÉRIFICATIONS</b><br/>
+    <br/>
+    <b>Résumé du vol:</b><br/>
+    Distance totale: <b>{total_distance:.1f} milles nautiques</b><br/>
+    Temps total de vol: <b>{total_time / 60:.1f} heures ({total_time:.0f} minutes)</b><br/>
+    <br/>
+    <b>Analyse carburant:</b><br/>
+    Carburant de route: <b>{total_fuel:.1f} gallons</b><br/>
+    Carburant de réserve: <b>{reserve_fuel:.1f} gallons</b><br/>
+    <b>Carburant total requis: {total_fuel_required:.1f} gallons</b><br/>
+    Capacité réservoir: {fuel_capacity} gallons<br/>
+    <br/>
+    <b>Vérifications pré-vol:</b><br/>
+    ☐ Briefing météo: {get('weather_brief', 'Requis')}<br/>
+    ☐ Vérification NOTAM: {get('notam_check', 'Requise')}<br/>
+    ☐ Plan de vol déposé: {get('flight_plan_filed', 'À faire')}<br/>
+    ☐ Suivi de vol: {get('flight_following', 'Recommandé')}<br/>
+    <br/>
+    <b>Aérodromes alternatifs:</b><br/>
+    Alternatif de départ: {get('departure_alternate', 'À définir')}<br/>
+    Alternatif en route: {get('enroute_alternate', 'À définir')}<br/>
+    Alternatif destination: {get('destination_alternate', 'À définir')}<br/>
+    <br/>
+    <b>Signatures:</b><br/>
+    <br/>
+    Pilote commandant: _________________________ Date: __________<br/>
+    <br/>
+    Instructeur (si requis): _____________________ Date: __________<br/>
+    <br/>
+    Dispatcher (si applicable): __________________ Date: __________<br/>
+    """
+
+    calculations_para = Paragraph(calculations_text, styles['Normal'])
+    story.append(calculations_para)
+
+    return story
+
 
-        general_table = Table(general_data, colWidths=[1.2 * inch, 1.8 * inch, 1.2 * inch, 1.8 * inch])
-        general_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (1, 0), colors.darkblue),
-            ('BACKGROUND', (2, 0), (3, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (3, 0), colors.whitesmoke),
-            ('BACKGROUND', (0, 1), (0, -1), colors.lightgrey),
-            ('BACKGROUND', (2, 1), (2, -1), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 1), (2, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-
-        story.append(general_table)
-        story.append(Spacer(1, 20))
-
-        # Table des segments de navigation
-        nav_heading = Paragraph("JOURNAL DE NAVIGATION", heading_style)
-        story.append(nav_heading)
-
-        # En-têtes du tableau des legs
-        headers = [
-            "Leg", "De", "À", "Dist\n(NM)", "CV\n(°)", "CM\n(°)",
-            "Vent", "VS\n(kn)", "Temps\n(min)", "Carb\n(gal)", "ETA"
+def _build_simple_story(flight_data: Dict[str, Any], legs_data: List[Dict]) -> List:
+    """
+    Construire les éléments de l'export PDF simplifié (voir :func:`create_simple_pdf_export`).
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :return: Éléments du document: titre, informations, tableau et totaux.
+    :rtype: List
+    """
+    styles = _pdf_styles().sheet
+    story = []
+
+    # Titre simple
+    title = Paragraph("Plan de Vol VFR", styles['Title'])
+    story.append(title)
+    story.append(Spacer(1, 12))
+
+    # Informations de base
+    get = flight_data.get
+    info_text = f"""
+    <b>Avion:</b> {get('aircraft_id', 'N/A')}<br/>
+    <b>Pilote:</b> {get('pilot', 'N/A')}<br/>
+    <b>Date:</b> {get('date', 'N/A')}<br/>
+    <b>Départ:</b> {get('departure', 'N/A')} à {get('etd', 'N/A')}<br/>
+    <b>Arrivée:</b> {get('destination', 'N/A')}<br/>
+    """
+
+    info_para = Paragraph(info_text, styles['Normal'])
+    story.append(info_para)
+    story.append(Spacer(1, 20))
+
+    # Table simple des legs
+    simple_headers = ["#", "De", "À", "Distance", "Cap", "Temps", "ETA"]
+    simple_data = [simple_headers]
+
+    total_distance = 0
+    for i, leg in enumerate(legs_data, 1):
+        distance = leg.get('distance', 0)
+        total_distance += distance
+        row = [
+            str(i),
+            leg.get('from', ''),
+            leg.get('to', ''),
+            f"{distance:.1f} NM",
+            f"{leg.get('mag_heading', 0):.0f}°",
+            f"{leg.get('leg_time', 0):.0f} min",
+            leg.get('eta', '')
         ]
+        simple_data.append(row)
 
-        legs_table_data = [headers]
-
-        # Données des legs
-        for i, leg in enumerate(legs_data, 1):
-            wind_str = f"{leg.get('wind_dir', 0):.0f}°/{leg.get('wind_speed', 0):.0f}"
-            row = [
-                str(i),
-                leg.get('from', '')[:6],  # Limiter la longueur
-                leg.get('to', '')[:6],
-                f"{leg.get('distance', 0):.0f}",
-                f"{leg.get('true_course', 0):.0f}",
-                f"{leg.get('mag_heading', 0):.0f}",
-                wind_str,
-                f"{leg.get('ground_speed', 0):.0f}",
-                f"{leg.get('leg_time', 0):.0f}",
-                f"{leg.get('fuel_leg', 0):.1f}",
-                leg.get('eta', '')[:5]
-            ]
-            legs_table_data.append(row)
-
-        # Calculer largeurs colonnes
-        col_widths = [0.4, 0.6, 0.6, 0.5, 0.4, 0.4, 0.6, 0.4, 0.5, 0.5, 0.5]
-        col_widths = [w * inch for w in col_widths]
-
-        legs_table = Table(legs_table_data, colWidths=col_widths, repeatRows=1)
-        legs_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 8),
-            ('FONTSIZE', (0, 1), (-1, -1), 7),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-
-        story.append(legs_table)
-        story.append(Spacer(1, 20))
+    simple_table = Table(simple_data)
+    simple_table.setStyle(_SIMPLE_TABLE_STYLE)
 
-        # Calculs et vérifications
-        total_distance = sum(leg.get('distance', 0) for leg in legs_data)
-        total_time = legs_data[-1].get('total_time', 0) if legs_data else 0
-        total_fuel = legs_data[-1].get('fuel_total', 0) if legs_data else 0
-        reserve_fuel = flight_data.get('reserve_fuel', 45) * flight_data.get('fuel_burn', 7.5) / 60
-        total_fuel_required = total_fuel + reserve_fuel
-
-        calculations_text = f"""
-        <b>CALCULS ET VÉRIFICATIONS</b><br/>
-        <br/>
-        <b>Résumé du vol:</b><br/>
-        Distance totale: <b>{total_distance:.1f} milles nautiques</b><br/>
-        Temps total de vol: <b>{total_time / 60:.1f} heures ({total_time:.0f} minutes)</b><br/>
-        <br/>
-        <b>Analyse carburant:</b><br/>
-        Carburant de route: <b>{total_fuel:.1f} gallons</b><br/>
-        Carburant de réserve: <b>{reserve_fuel:.1f} gallons</b><br/>
-        <b>Carburant total requis: {total_fuel_required:.1f} gallons</b><br/>
-        Capacité réservoir: {flight_data.get('fuel_capacity', 'N/A')} gallons<br/>
-        <br/>
-        <b>Vérifications pré-vol:</b><br/>
-        ☐ Briefing météo: {flight_data.get('weather_brief', 'Requis')}<br/>
-        ☐ Vérification NOTAM: {flight_data.get('notam_check', 'Requise')}<br/>
-        ☐ Plan de vol déposé: {flight_data.get('flight_plan_filed', 'À faire')}<br/>
-        ☐ Suivi de vol: {flight_data.get('flight_following', 'Recommandé')}<br/>
-        <br/>
-        <b>Aérodromes alternatifs:</b><br/>
-        Alternatif de départ: {flight_data.get('departure_alternate', 'À définir')}<br/>
-        Alternatif en route: {flight_data.get('enroute_alternate', 'À définir')}<br/>
-        Alternatif destination: {flight_data.get('destination_alternate', 'À définir')}<br/>
-        <br/>
-        <b>Signatures:</b><br/>
-        <br/>
-        Pilote commandant: _________________________ Date: __________<br/>
-        <br/>
-        Instructeur (si requis): _____________________ Date: __________<br/>
-        <br/>
-        Dispatcher (si applicable): __________________ Date: __________<br/>
-        """
-
-        calculations_para = Paragraph(calculations_text, styles['Normal'])
-        story.append(calculations_para)
-
-        # Générer le PDF
-        doc.build(story)
+    story.append(simple_table)
+
+    # Totaux (distance cumulée avec les lignes du tableau)
+    total_time = legs_data[-1].get('total_time', 0) if legs_data else 0
+
+    totals_text = f"""
+    <br/>
+    <b>TOTAUX:</b><br/>
+    Distance totale: {total_distance:.1f} NM<br/>
+    Temps total: {total_time / 60:.1f} heures<br/>
+    """
+
+    totals_para = Paragraph(totals_text, styles['Normal'])
+    story.append(totals_para)
+
+    return story
+
+
+def _build_briefing_story(flight_data: Dict[str, Any], legs_data: List[Dict],
+                          generated: str) -> List:
+    """
+    Construire les éléments du briefing de vol (voir :func:`create_flight_briefing_pdf`).
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :param generated: Date et heure de génération du plan de vol détaillé.
+    :type generated: str
+    :return: Éléments du document: résumé, liste de vérification et plan de vol détaillé.
+    :rtype: List
+    """
+    styles = _pdf_styles().sheet
+    story = []
+
+    # Page 1: Plan de vol principal
+    title = Paragraph("BRIEFING DE VOL VFR", styles['Title'])
+    story.append(title)
+    story.append(Spacer(1, 20))
+
+    # Résumé exécutif
+    get = flight_data.get
+    total_distance = sum(leg.get('distance', 0) for leg in legs_data)
+    last_leg = legs_data[-1] if legs_data else {}
+    total_time = last_leg.get('total_time', 0)
+    total_fuel = last_leg.get('fuel_total', 0)
+
+    summary_text = f"""
+    <b>RÉSUMÉ EXÉCUTIF</b><br/>
+    <br/>
+    Vol: {get('departure', 'N/A')} → {get('destination', 'N/A')}<br/>
+    Date: {get('date', 'N/A')} à {get('etd', 'N/A')}<br/>
+    Avion: {get('aircraft_id', 'N/A')} ({get('aircraft_type', 'N/A')})<br/>
+    Pilote: {get('pilot', 'N/A')}<br/>
+    <br/>
+    Distance: {total_distance:.1f} NM<br/>
+    Temps estimé: {total_time / 60:.1f} heures<br/>
+    Carburant requis: {total_fuel:.1f} gallons<br/>
+    """
+
+    summary_para = Paragraph(summary_text, styles['Normal'])
+    story.append(summary_para)
+    story.append(Spacer(1, 20))
+
+    # Points de vérification
+    story.append(copy(_static_paragraph(_CHECKLIST_TEXT)))
+
+    # Nouvelle page pour les détails: plan de vol détaillé dans le même document
+    story.append(PageBreak())
+    story.extend(_build_flight_plan_story(flight_data, legs_data, generated))
+
+    return story
+
+
+def _generated_stamp() -> str:
+    """
+    Date et heure de génération affichées dans les documents (à la minute près).
+
+    :return: Horodatage au format "AAAA-MM-JJ à HH:MM".
+    :rtype: str
+    """
+    return datetime.now().strftime('%Y-%m-%d à %H:%M')
+
+
+def _freeze(value):
+    """
+    Convertir des données de vol en valeur hachable pour la clé du cache des PDF.
+
+    Le type des scalaires fait partie de la clé: 110 et 110.0 (ou 0.0 et -0.0) ne
+    s'affichent pas de la même façon.
+
+    :param value: Dictionnaire, liste ou scalaire.
+    :return: Représentation hachable de la valeur.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, float):
+        return float, value.hex()
+    return type(value), value
+
+
+def _render_pdf(build_story: Callable[..., List], flight_data: Dict[str, Any],
+                legs_data: List[Dict], *story_args, **doc_options) -> bytes:
+    """
+    Générer un PDF en mémoire, ou le reprendre du cache si les mêmes données ont déjà été exportées.
+
+    Les :data:`_PDF_CACHE_SIZE` derniers documents sont conservés. La clé comprend les données
+    du vol et les arguments du document (dont l'horodatage de génération): un export répété
+    dans la même minute renvoie les mêmes octets. Des données non hachables sont générées
+    sans cache.
+
+    :param build_story: Fonction construisant les éléments du document.
+    :type build_story: Callable[..., List]
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :param story_args: Arguments supplémentaires de build_story.
+    :param doc_options: Options de SimpleDocTemplate (pagesize, marges).
+    :return: Contenu du fichier PDF.
+    :rtype: bytes
+    """
+    try:
+        key = (build_story.__name__, story_args, _freeze(flight_data), _freeze(legs_data))
+        hash(key)
+    except TypeError:
+        key = None
+
+    if key is not None:
+        with _pdf_cache_lock:
+            data = _pdf_cache.get(key)
+            if data is not None:
+                _pdf_cache.move_to_end(key)
+                return data
+
+    data = _build_pdf(build_story(flight_data, legs_data, *story_args), **doc_options)
+
+    if key is not None:
+        with _pdf_cache_lock:
+            _pdf_cache[key] = data
+            if len(_pdf_cache) > _PDF_CACHE_SIZE:
+                _pdf_cache.popitem(last=False)
+    return data
+
+
+def _build_pdf(story: List, **doc_options) -> bytes:
+    """
+    Mettre en page un document PDF en mémoire.
+
+    :param story: Éléments (flowables) du document.
+    :type story: List
+    :param doc_options: Options de SimpleDocTemplate (pagesize, marges).
+    :return: Contenu du fichier PDF.
+    :rtype: bytes
+    """
+    buffer = io.BytesIO()
+    SimpleDocTemplate(buffer, **doc_options).build(story)
+    return buffer.getvalue()
+
+
+def _write_pdf(filename: str, data: bytes):
+    """
+    Écrire un PDF déjà généré en un seul bloc.
+
+    Le fichier n'est ouvert qu'une fois la mise en page réussie: une erreur de génération
+    ne laisse pas de fichier vide ou tronqué.
+
+    :param filename: Nom du fichier PDF de sortie.
+    :type filename: str
+    :param data: Contenu du fichier PDF.
+    :type data: bytes
+    """
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+def export_to_pdf(flight_data: Dict[str, Any], legs_data: List[Dict],
+                 filename: str = "flight_plan.pdf"):
+    """
+    Exporter un plan de vol vers un fichier PDF.
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :param filename: Nom du fichier PDF de sortie.
+    :type filename: str
+    :raises PDFExportError: En cas d'erreur lors de la génération du PDF.
+    """
+    try:
+        # Générer le PDF en mémoire (ou le reprendre du cache), puis l'écrire en un bloc
+        generated = _generated_stamp()
+        data = _render_pdf(
+            _build_flight_plan_story, flight_data, legs_data, generated,
+            pagesize=letter,
+            leftMargin=0.5 * inch,
+            rightMargin=0.5 * inch,
+            topMargin=0.5 * inch,
+            bottomMargin=0.5 * inch
+        )
+        _write_pdf(filename, data)
         print(f"Plan de vol PDF sauvegardé: {filename}")
 
-    except Exception as e:
-        raise Exception(f"Erreur lors de la génération PDF: {e}")
+    except _EXPORT_ERRORS as e:
+        raise PDFExportError(f"Erreur lors de la génération PDF: {e}") from e
+
+
+def export_to_pdf_async(flight_data: Dict[str, Any], legs_data: List[Dict],
+                        filename: str = "flight_plan.pdf") -> Future:
+    """
+    Exporter un plan de vol vers un fichier PDF dans un thread en arrière-plan.
+
+    La construction du document et l'écriture du fichier se font hors du thread appelant,
+    qui reste libre (boucle d'événements de l'interface graphique par exemple). Les données
+    ne doivent pas être modifiées avant la fin de l'export.
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :param filename: Nom du fichier PDF de sortie.
+    :type filename: str
+    :return: Future dont le résultat est le nom du fichier généré; l'exception éventuelle
+             de :func:`export_to_pdf` est relevée par ``future.result()``.
+    :rtype: Future
+    """
+    return _PDF_EXECUTOR.submit(_export_pdf_job, flight_data, legs_data, filename)
+
+
+def _export_pdf_job(flight_data: Dict[str, Any], legs_data: List[Dict], filename: str) -> str:
+    """
+    Exporter un plan de vol et renvoyer le nom du fichier (tâche du pool de threads).
+
+    :param flight_data: Données générales du vol.
+    :type flight_data: Dict[str, Any]
+    :param legs_data: Liste des segments du vol.
+    :type legs_data: List[Dict]
+    :param filename: Nom du fichier PDF de sortie.
+    :type filename: str
+    :return: Nom du fichier généré.
+    :rtype: str
+    """
+    export_to_pdf(flight_data, legs_data, filename)
+    return filename
 
 
 def create_simple_pdf_export(flight_data: Dict[str, Any], legs_data: List[Dict],
@@ -223,77 +620,15 @@ def create_simple_pdf_export(flight_data: Dict[str, Any], legs_data: List[Dict],
     :type legs_data: List[Dict]
     :param filename: Nom du fichier PDF à générer.
     :type filename: str
-    :raises Exception: En cas d'erreur lors de la création ou de la sauvegarde du PDF.
+    :raises PDFExportError: En cas d'erreur lors de la création ou de la sauvegarde du PDF.
     """
     try:
-        doc = SimpleDocTemplate(filename, pagesize=A4)
-        styles = getSampleStyleSheet()
-        story = []
-
-        # Titre simple
-        title = Paragraph("Plan de Vol VFR", styles['Title'])
-        story.append(title)
-        story.append(Spacer(1, 12))
-
-        # Informations de base
-        info_text = f"""
-        <b>Avion:</b> {flight_data.get('aircraft_id', 'N/A')}<br/>
-        <b>Pilote:</b> {flight_data.get('pilot', 'N/A')}<br/>
-        <b>Date:</b> {flight_data.get('date', 'N/A')}<br/>
-        <b>Départ:</b> {flight_data.get('departure', 'N/A')} à {flight_data.get('etd', 'N/A')}<br/>
-        <b>Arrivée:</b> {flight_data.get('destination', 'N/A')}<br/>
-        """
-
-        info_para = Paragraph(info_text, styles['Normal'])
-        story.append(info_para)
-        story.append(Spacer(1, 20))
-
-        # Table simple des legs
-        simple_headers = ["#", "De", "À", "Distance", "Cap", "Temps", "ETA"]
-        simple_data = [simple_headers]
-
-        for i, leg in enumerate(legs_data, 1):
-            row = [
-                str(i),
-                leg.get('from', ''),
-                leg.get('to', ''),
-                f"{leg.get('distance', 0):.1f} NM",
-                f"{leg.get('mag_heading', 0):.0f}°",
-                f"{leg.get('leg_time', 0):.0f} min",
-                leg.get('eta', '')
-            ]
-            simple_data.append(row)
-
-        simple_table = Table(simple_data)
-        simple_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
-
-        story.append(simple_table)
-
-        # Totaux
-        total_distance = sum(leg.get('distance', 0) for leg in legs_data)
-        total_time = legs_data[-1].get('total_time', 0) if legs_data else 0
-
-        totals_text = f"""
-        <br/>
-        <b>TOTAUX:</b><br/>
-        Distance totale: {total_distance:.1f} NM<br/>
-        Temps total: {total_time / 60:.1f} heures<br/>
-        """
-
-        totals_para = Paragraph(totals_text, styles['Normal'])
-        story.append(totals_para)
-
-        doc.build(story)
+        data = _render_pdf(_build_simple_story, flight_data, legs_data, pagesize=A4)
+        _write_pdf(filename, data)
         print(f"Plan PDF simple sauvegardé: {filename}")
 
-    except Exception as e:
-        raise Exception(f"Erreur export PDF simple: {e}")
+    except _EXPORT_ERRORS as e:
+        raise PDFExportError(f"Erreur export PDF simple: {e}") from e
 
 
 def create_flight_briefing_pdf(flight_data: Dict[str, Any], legs_data: List[Dict],
@@ -303,7 +638,7 @@ def create_flight_briefing_pdf(flight_data: Dict[str, Any], legs_data: List[Dict
     Créer un briefing de vol VFR complet au format PDF.
 
     Ce document comprend un résumé exécutif, une liste de vérification pré-vol,
-    ainsi qu'un export détaillé du plan de vol.
+    ainsi que le plan de vol détaillé (mêmes éléments que :func:`export_to_pdf`).
 
     :param flight_data: Données générales du vol (immatriculation, pilote, date, départ, destination, etc.).
     :type flight_data: Dict[str, Any]
@@ -313,82 +648,24 @@ def create_flight_briefing_pdf(flight_data: Dict[str, Any], legs_data: List[Dict
     :type weather_data: Dict[str, Any], optional
     :param filename: Nom du fichier PDF à générer.
     :type filename: str
-    :raises Exception: En cas d’erreur lors de la génération du PDF.
+    :raises PDFExportError: En cas d’erreur lors de la génération du PDF.
     """
     try:
-        doc = SimpleDocTemplate(filename, pagesize=letter)
-        styles = getSampleStyleSheet()
-        story = []
-
-        # Page 1: Plan de vol principal
-        title = Paragraph("BRIEFING DE VOL VFR", styles['Title'])
-        story.append(title)
-        story.append(Spacer(1, 20))
-
-        # Résumé exécutif
-        summary_text = f"""
-        <b>RÉSUMÉ EXÉCUTIF</b><br/>
-        <br/>
-        Vol: {flight_data.get('departure', 'N/A')} → {flight_data.get('destination', 'N/A')}<br/>
-        Date: {flight_data.get('date', 'N/A')} à {flight_data.get('etd', 'N/A')}<br/>
-        Avion: {flight_data.get('aircraft_id', 'N/A')} ({flight_data.get('aircraft_type', 'N/A')})<br/>
-        Pilote: {flight_data.get('pilot', 'N/A')}<br/>
-        <br/>
-        Distance: {sum(leg.get('distance', 0) for leg in legs_data):.1f} NM<br/>
-        Temps estimé: {(legs_data[-1].get('total_time', 0) if legs_data else 0) / 60:.1f} heures<br/>
-        Carburant requis: {legs_data[-1].get('fuel_total', 0) if legs_data else 0:.1f} gallons<br/>
-        """
-
-        summary_para = Paragraph(summary_text, styles['Normal'])
-        story.append(summary_para)
-        story.append(Spacer(1, 20))
-
-        # Points de vérification
-        checklist_text = """
-        <b>LISTE DE VÉRIFICATION PRÉ-VOL</b><br/>
-        <br/>
-        <b>Documentation:</b><br/>
-        ☐ Certificat d'immatriculation<br/>
-        ☐ Certificat de navigabilité<br/>
-        ☐ Licence radio<br/>
-        ☐ Manuel de vol<br/>
-        ☐ Cartes à jour<br/>
-        <br/>
-        <b>Planification:</b><br/>
-        ☐ Plan de vol calculé<br/>
-        ☐ Briefing météo obtenu<br/>
-        ☐ NOTAM vérifiés<br/>
-        ☐ Carburant suffisant<br/>
-        ☐ Aérodromes alternatifs identifiés<br/>
-        <br/>
-        <b>Communications:</b><br/>
-        ☐ Fréquences notées<br/>
-        ☐ Transpondeur testé<br/>
-        ☐ Plan de vol déposé (si requis)<br/>
-        """
-
-        checklist_para = Paragraph(checklist_text, styles['Normal'])
-        story.append(checklist_para)
-
-        # Nouvelle page pour les détails
-        story.append(PageBreak())
-
-        # Navigation détaillée (utiliser la fonction principale)
-        export_to_pdf(flight_data, legs_data, filename + "_temp")
-
-        # Note: Dans une implémentation complète, on combinerait les PDFs
-        # ou on restructurerait le code pour éviter les fichiers temporaires
-
-        doc.build(story)
+        generated = _generated_stamp()
+        data = _render_pdf(_build_briefing_story, flight_data, legs_data, generated, pagesize=letter)
+        _write_pdf(filename, data)
         print(f"Briefing de vol sauvegardé: {filename}")
 
-    except Exception as e:
-        raise Exception(f"Erreur briefing PDF: {e}")
+    except _EXPORT_ERRORS as e:
+        raise PDFExportError(f"Erreur briefing PDF: {e}") from e
 
 
 class FlightPlanPDFGenerator:
     """Générateur PDF avancé avec options personnalisables"""
 
+    # Styles personnalisés communs à toutes les instances, créés au premier générateur
+    _custom_styles = None
+
     def __init__(self, pagesize=letter, margins=None):
         self.pagesize = pagesize
         self.margins = margins or {
@@ -397,15 +674,22 @@ class FlightPlanPDFGenerator:
             'top': 0.5 * inch,
             'bottom': 0.5 * inch
         }
-        self.styles = getSampleStyleSheet()
+        self.styles = _pdf_styles().sheet
         self.setup_custom_styles()
 
     def setup_custom_styles(self):
         """Configurer les styles personnalisés"""
-        self.custom_styles = {
+        if FlightPlanPDFGenerator._custom_styles is None:
+            FlightPlanPDFGenerator._custom_styles = self._build_custom_styles(self.styles)
+        self.custom_styles = FlightPlanPDFGenerator._custom_styles
+
+    @staticmethod
+    def _build_custom_styles(styles) -> Dict[str, ParagraphStyle]:
+        """Créer les styles personnalisés à partir de la feuille de styles de base"""
+        return {
             'title': ParagraphStyle(
                 'VFRTitle',
-                parent=self.styles['Title'],
+                parent=styles['Title'],
                 fontSize=18,
                 textColor=colors.darkblue,
                 alignment=1,
@@ -413,7 +697,7 @@ class FlightPlanPDFGenerator:
             ),
             'heading': ParagraphStyle(
                 'VFRHeading',
-                parent=self.styles['Heading2'],
+                parent=styles['Heading2'],
                 fontSize=12,
                 textColor=colors.darkblue,
                 spaceBefore=15,
@@ -421,7 +705,7 @@ class FlightPlanPDFGenerator:
             ),
             'warning': ParagraphStyle(
                 'VFRWarning',
-                parent=self.styles['Normal'],
+                parent=styles['Normal'],
                 textColor=colors.red,
                 fontSize=10,
                 leftIndent=20
@@ -431,12 +715,6 @@ class FlightPlanPDFGenerator:
     def generate_complete_plan(self, flight_data: Dict[str, Any],
                              legs_data: List[Dict], filename: str):
         """Générer un plan complet avec toutes les sections"""
-        doc = SimpleDocTemplate(
-            filename,
-            pagesize=self.pagesize,
-            **self.margins
-        )
-
         story = []
 
         # Titre et en-tête
@@ -454,7 +732,7 @@ class FlightPlanPDFGenerator:
         # Sections de sécurité
         story.extend(self._create_safety_sections())
 
-        doc.build(story)
+        _write_pdf(filename, _build_pdf(story, pagesize=self.pagesize, **self.margins))
         print(f"Plan complet généré: {filename}")
 
     def _create_header(self, flight_data: Dict[str, Any]) -> List:
@@ -465,7 +743,7 @@ class FlightPlanPDFGenerator:
         elements.append(title)
 
         subtitle = Paragraph(
-            f"Généré le {datetime.now().strftime('%Y-%m-%d à %H:%M')}",
+            f"Généré le {_generated_stamp()}",
             self.styles['Normal']
         )
         elements.append(subtitle)
@@ -514,17 +792,7 @@ class FlightPlanPDFGenerator:
         """Créer les sections de sécurité"""
         elements = []
 
-        safety_text = """
-        <b>CONSIGNES DE SÉCURITÉ</b><br/>
-        <br/>
-        • Vérifiez les conditions météo avant le départ<br/>
-        • Respectez les minimums VFR en tout temps<br/>
-        • Maintenez une veille radio appropriée<br/>
-        • Suivez les procédures d'urgence en cas de problème<br/>
-        """
-
-        safety_para = Paragraph(safety_text, self.styles['Normal'])
-        elements.append(safety_para)
+        elements.append(copy(_static_paragraph(_SAFETY_TEXT)))
 
         return elements
 
@@ -1233,7 +1233,8 @@ class PlanTab(ttk.Frame):
         Exporter l'itinéraire calculé vers un fichier PDF.
 
         Ouvre une boîte de dialogue pour choisir le fichier de destination.
-        Utilise la fonction `export_to_pdf` pour créer le fichier PDF.
+        Utilise la fonction `export_to_pdf_async` pour créer le fichier PDF en arrière-plan,
+        sans bloquer l'interface; le résultat est vérifié par `_check_pdf_export`.
         Affiche un message d'erreur si aucun itinéraire n'a été calculé
         ou si une erreur survient lors de l'export.
 
@@ -1251,16 +1252,41 @@ class PlanTab(ttk.Frame):
 
         if filename:
             try:
-                from ..export.pdf_export import export_to_pdf
+                from ..export.pdf_export import export_to_pdf_async
                 flight_data, legs_data = self.calculated_itinerary.get_flight_plan_data()
-                export_to_pdf(flight_data, legs_data, filename)
+                future = export_to_pdf_async(flight_data, legs_data, filename)
 
-                messagebox.showinfo("Succès", f"Plan exporté vers:\n{filename}")
-                self.main_window.status_bar.set_status(f"Export PDF: {filename}")
+                self.main_window.status_bar.set_status(f"Export PDF en cours: {filename}")
+                self.after(100, self._check_pdf_export, future, filename)
 
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur export PDF:\n{e}")
 
+    def _check_pdf_export(self, future, filename):
+        """
+        Vérifier périodiquement la fin d'un export PDF en arrière-plan.
+
+        Tkinter n'étant pas thread-safe, le résultat est lu ici, dans la boucle
+        d'événements, plutôt que dans un callback du thread d'export.
+
+        :param future: Future renvoyé par `export_to_pdf_async`.
+        :type future: concurrent.futures.Future
+        :param filename: Nom du fichier PDF en cours de génération.
+        :type filename: str
+        :return: None
+        """
+        if not future.done():
+            self.after(100, self._check_pdf_export, future, filename)
+            return
+
+        try:
+            future.result()
+            messagebox.showinfo("Succès", f"Plan exporté vers:\n{filename}")
+            self.main_window.status_bar.set_status(f"Export PDF: {filename}")
+
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur export PDF:\n{e}")
+
     def show_map(self):
         """
         Afficher la carte interactive du plan de vol.